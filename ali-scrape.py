@@ -1,22 +1,58 @@
 # pip install selenium webdriver-manager
+#
+# usage: python ali-scrape.py [url ...]
+# One Chrome instance is started and reused for every URL given.
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
-import time
+import re
+import sys
 
-URL = "https://pl.aliexpress.com/item/1005006722922099.html"
+URLS = sys.argv[1:] or ["https://pl.aliexpress.com/item/1005006722922099.html"]
 OUTPUT = "aliexpress_full.html"
+WAIT_TIMEOUT = 10                          # seconds, upper bound per page
+
+# Resolves inside the page as soon as the DOM is parsed and the price is
+# rendered – one WebDriver round trip instead of polling every 500 ms.
+WAIT_FOR_PRICE = """
+const done = arguments[arguments.length - 1];
+const ready = () => document.readyState !== "loading"
+    && document.querySelector("span.product-price-value");
+if (ready()) return done(true);
+const observer = new MutationObserver(() => {
+    if (ready()) { observer.disconnect(); done(true); }
+});
+observer.observe(document, {childList: true, subtree: true});
+"""
+
+# AliExpress inlines the product JSON as window.runParams; when it holds
+# data, the saved HTML already has everything and no scrolling is needed.
+# Client-side-rendered pages ship an empty `window.runParams = {};`.
+HAS_PAGE_DATA = "return !!window.runParams && Object.keys(window.runParams).length > 0;"
+
+# Otherwise scroll to the bottom and resolve once lazy-loaded modules have
+# stopped changing the DOM for 500 ms (bounded by the script timeout).
+SCROLL_AND_SETTLE = """
+const done = arguments[arguments.length - 1];
+let timer = setTimeout(finish, 500);
+const observer = new MutationObserver(() => {
+    clearTimeout(timer);
+    timer = setTimeout(finish, 500);
+});
+function finish() { observer.disconnect(); done(true); }
+observer.observe(document.body, {childList: true, subtree: true});
+window.scrollTo(0, document.body.scrollHeight);
+"""
 
 # ── 1. Chrome options ───────────────────────────────────────────────
 opts = Options()
 opts.add_argument("--headless=new")        # Chrome 109+ headless mode
 opts.add_argument("--disable-gpu")
 opts.add_argument("--window-size=1920,1080")
+opts.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
 
 # (optional) run through a proxy
 # opts.add_argument("--proxy-server=http://37.48.118.4:13151")
@@ -24,31 +60,66 @@ opts.add_argument("--window-size=1920,1080")
 # (optional) import your own cookies so price & currency match the browser
 # driver.add_cookie({"name": "_m_h5_tk", "value": "…", "domain": ".aliexpress.com"})
 
-# ── 2. Start browser ────────────────────────────────────────────────
+# ── 2. Start browser (once for all URLs) ────────────────────────────
 driver = webdriver.Chrome(
     service=Service(ChromeDriverManager().install()),
     options=opts,
 )
+driver.set_script_timeout(WAIT_TIMEOUT)
+
+# only the HTML is saved, so don't download images, media, fonts or trackers
+driver.execute_cdp_cmd("Network.enable", {})
+driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.mp4",
+    "*.woff*", "*.css", "*/analytics/*", "*/gtag/*",
+]})
 
 try:
-    # ── 3. Open the page and wait for a key element ────────────────
-    driver.get(URL)
+    for n, url in enumerate(URLS, 1):
+        # a single URL keeps the historic output name; several URLs get one file each
+        if len(URLS) == 1:
+            output = OUTPUT
+        else:
+            item_id = re.search(r"/item/(\d+)\.html", url)
+            output = f"aliexpress_{item_id.group(1) if item_id else n}.html"
+
+        # start every URL after the first from a clean session
+        # (much cheaper than restarting Chrome)
+        if n > 1:
+            try:
+                # a failed load leaves an opaque "null" origin that CDP rejects
+                origin = driver.execute_script("return window.location.origin")
+                if origin and origin.startswith("http"):
+                    driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                        "origin": origin,
+                        "storageTypes": "all",
+                    })
+                driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+                driver.delete_all_cookies()
+            except Exception as e:
+                print(f"✘ Could not reset the browser session: {e}")
+
+        # ── 3. Open the page and wait for the price to render ──────
+        driver.get(url)
 
-    WebDriverWait(driver, 30).until(
-        EC.presence_of_element_located(
-            (By.CSS_SELECTOR, "span.product-price-value")
-        )
-    )
+        try:
+            driver.execute_async_script(WAIT_FOR_PRICE)
+        except TimeoutException:
+            print(f"✘ Timed out waiting for {url}")
+            continue
 
-    # ── 4. Scroll once to trigger lazy-load images / modules ────────
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(2)             # short pause so images/text can load
+        # ── 4. Scroll to trigger lazy-loaded modules (only if needed)
+        if not driver.execute_script(HAS_PAGE_DATA):
+            try:
+                driver.execute_async_script(SCROLL_AND_SETTLE)
+            except TimeoutException:
+                pass              # save whatever has loaded so far
 
-    # ── 5. Dump the final HTML ──────────────────────────────────────
-    with open(OUTPUT, "w", encoding="utf-8") as f:
-        f.write(driver.page_source)
+        # ── 5. Dump the final HTML ──────────────────────────────────
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(driver.page_source)
 
-    print(f"✔ Done – full HTML saved to {OUTPUT}")
+        print(f"✔ Done – full HTML saved to {output}")
 
 finally:
     driver.quit()
@@ -4,147 +4,712 @@ AliExpress Batch Scraper
 
 This script processes multiple AliExpress URLs from the 9kAliexpresUrls.txt file
 and scrapes them in batches with proper rate limiting and error handling.
+Pages are fetched concurrently with aiohttp; a headless browser (Playwright,
+or Selenium as a fallback) is only started for pages whose static HTML lacks
+the product data.
 """
 
+import argparse
+import asyncio
 import json
+import queue
+import threading
 import time
 import random
 import os
-import sys
-from datetime import datetime
-from typing import List, Dict, Any
-from live_aliexpress_scraper import AliExpressLiveScraper
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import aiohttp
+import ijson
+
+try:
+    import orjson
+except ImportError:  # fall back to the standard library encoder
+    orjson = None
+
+from live_aliexpress_scraper import AliExpressLiveScraper, USER_AGENT
+
+
+# Connection limit towards a single host, independent of max_concurrency
+LIMIT_PER_HOST = 8
+
+# Responses worth retrying; other HTTP errors fail the URL immediately
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Upper bound for the exponential backoff between retries (seconds)
+MAX_BACKOFF = 60
+
+# Scraped products are appended to this JSON Lines file in the output directory
+PRODUCTS_FILE = "products.jsonl"
+
+# Per-URL outcome records, appended as each URL finishes
+RESULTS_FILE = "results.jsonl"
+FAILURES_FILE = "failures.jsonl"
+
+# Headless Chrome is memory hungry, so only a few run side by side
+BROWSER_POOL_SIZE = min(4, os.cpu_count() or 1)
+
+# Restart each browser after this many pages to contain Chrome's memory growth
+BROWSER_RECYCLE_AFTER = 50
+
+# Playwright pages rendered at once; each gets its own context in one shared browser
+PLAYWRIGHT_CONTEXTS = 8
+
+# Tasks parsing downloaded HTML (in threads) and rendering pages in a browser
+PARSE_WORKERS = os.cpu_count() or 1
+RENDER_WORKERS = PLAYWRIGHT_CONTEXTS
+
+# Resources Playwright pages never download (only the HTML is parsed)
+PLAYWRIGHT_BLOCKED = "**/*.{png,jpg,jpeg,webp,gif,mp4,woff,woff2,css}"
+
+# Any of these means the product page has been rendered
+PRODUCT_SELECTORS = "span.product-price-value, [data-pl='product-title'], .price--currentPriceText--V8_y_b5"
+
+# Query parameters that only track the visit and never change the product page
+TRACKING_PARAMS = {'spm', 'scm', 'pvid', 'aff_trace_key', 'aff_platform', 'aff_fcid',
+                   'aff_fsk', 'sk', 'terminal_id', 'afSmartRedirect', 'gatewayAdapt',
+                   'algo_pvid', 'algo_exp_id', 'btsid', 'ws_ab_test', 'utparam', 'srcSns',
+                   'spreadType', 'bizType', 'social_params', 'tt', 'mb', 'sourceType'}
+
+
+def canonicalize_url(url: str) -> str:
+    """Strip tracking parameters and the fragment so variants of one page compare equal."""
+    parts = urlsplit(url.strip())
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+             if key not in TRACKING_PARAMS and not key.startswith('utm_')]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ''))
+
+
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convert a Retry-After header (seconds or HTTP date) into a delay."""
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _parse_rate_reset(value: Optional[str]) -> Optional[float]:
+    """Convert a rate-limit reset header (seconds or Unix time) into a delay."""
+    if not value:
+        return None
+    
+    try:
+        reset = float(value.split(',')[0].split(';')[0])
+    except ValueError:
+        return None
+    if reset >= 1e9:  # X-RateLimit-Reset is often an epoch timestamp
+        reset -= time.time()
+    return min(MAX_BACKOFF, max(0.0, reset))
+
+
+class BackgroundJsonWriter:
+    """
+    Appends JSON records to JSON Lines files from a single background thread.
+    
+    Each target file is opened once and kept open until close(). Records
+    that pile up while a write is in progress are collected into one
+    batch, so a burst of results costs a single write() per file instead
+    of one per record. The queue is unbounded, so put() never blocks and
+    the event loop never waits on disk I/O, even when the disk falls behind.
+    """
+    
+    def __init__(self, max_batch: int = 64):
+        """
+        Start the writer thread.
+        
+        Args:
+            max_batch: Maximum number of records combined into one write
+        """
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+    
+    def put(self, path: str, record: Dict[str, Any]):
+        """Queue a record to be appended to the file at path, without blocking."""
+        self._queue.put_nowait((path, record))
+    
+    def close(self):
+        """Flush all queued records and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+    
+    def _next_batch(self) -> List[Any]:
+        """Block for one queued item, then take whatever else is already waiting."""
+        batch = [self._queue.get()]
+        while batch[-1] is not None and len(batch) < self.max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+    
+    def _drain(self):
+        """Write queued records in batches until the stop sentinel arrives."""
+        files = {}
+        stopping = False
+        
+        try:
+            while not stopping:
+                pending = {}
+                for item in self._next_batch():
+                    if item is None:
+                        stopping = True
+                        break
+                    path, record = item
+                    pending.setdefault(path, []).append(_dumps(record) + b"\n")
+                
+                for path, lines in pending.items():
+                    try:
+                        f = files.get(path)
+                        if f is None:
+                            f = files[path] = open(path, 'ab')
+                        f.write(b"".join(lines))
+                        f.flush()
+                    except Exception as e:
+                        print(f"Error writing to {path}: {e}")
+        finally:
+            for f in files.values():
+                f.close()
+
+
+class BrowserPool:
+    """
+    Bounded pool of Selenium scrapers shared by async tasks.
+    
+    Browsers are started on demand up to the pool size, reused across
+    URLs with their session cleared in between, and replaced by a fresh
+    one after a fixed number of pages.
+    """
+    
+    def __init__(self, size: int, headless: bool = True, proxy: str = None,
+                 recycle_after: int = BROWSER_RECYCLE_AFTER):
+        """
+        Initialize an empty pool.
+        
+        Args:
+            size: Maximum number of browsers running at once
+            headless: Whether to run browsers in headless mode
+            proxy: Optional proxy server
+            recycle_after: Pages served before a browser is restarted
+        """
+        self.size = size
+        self.headless = headless
+        self.proxy = proxy
+        self.recycle_after = recycle_after
+        self._slots = asyncio.Semaphore(size)
+        self._idle = []
+        self._uses = {}
+    
+    async def acquire(self) -> AliExpressLiveScraper:
+        """Take an idle browser, starting a new one if none is idle."""
+        await self._slots.acquire()
+        try:
+            if self._idle:
+                return self._idle.pop()
+            scraper = await asyncio.to_thread(
+                AliExpressLiveScraper, headless=self.headless, proxy=self.proxy
+            )
+        except Exception:
+            self._slots.release()
+            raise
+        
+        self._uses[scraper] = 0
+        return scraper
+    
+    async def release(self, scraper: AliExpressLiveScraper):
+        """Return a browser to the pool, quitting it if it is worn out."""
+        try:
+            self._uses[scraper] += 1
+            if self._uses[scraper] >= self.recycle_after:
+                del self._uses[scraper]
+                await asyncio.to_thread(scraper.close)
+            else:
+                await asyncio.to_thread(scraper.reset)
+                self._idle.append(scraper)
+        finally:
+            self._slots.release()
+    
+    async def scrape(self, url: str, wait_time: int = 20) -> Dict[str, Any]:
+        """Scrape one URL on a pooled browser."""
+        scraper = await self.acquire()
+        try:
+            return await asyncio.to_thread(scraper.scrape_product, url, wait_time)
+        finally:
+            await self.release(scraper)
+    
+    async def close(self):
+        """Quit every idle browser."""
+        while self._idle:
+            scraper = self._idle.pop()
+            del self._uses[scraper]
+            await asyncio.to_thread(scraper.close)
+
+
+class PlaywrightRenderer:
+    """
+    Renders JavaScript pages with Playwright's async API.
+    
+    A single Chromium is launched on first use and every URL is loaded in
+    its own lightweight BrowserContext, so many pages render concurrently
+    without the per-command HTTP round trips of Selenium.
+    """
+    
+    def __init__(self, parser: AliExpressLiveScraper, size: int = PLAYWRIGHT_CONTEXTS,
+                 headless: bool = True, proxy: str = None):
+        """
+        Initialize the renderer without starting a browser.
+        
+        Args:
+            parser: Scraper used to extract product data from rendered HTML
+            size: Maximum number of pages rendered at once
+            headless: Whether to run the browser in headless mode
+            proxy: Optional proxy server
+        """
+        self.parser = parser
+        self.headless = headless
+        self.proxy = proxy
+        self._slots = asyncio.Semaphore(size)
+        self._lock = asyncio.Lock()
+        self._playwright = None
+        self._browser = None
+    
+    async def _get_browser(self):
+        """Launch the shared browser the first time it is needed."""
+        async with self._lock:
+            if self._browser is None:
+                from playwright.async_api import async_playwright
+                
+                launch_options = {'headless': self.headless, 'args': ["--disable-gpu"]}
+                if self.proxy:
+                    launch_options['proxy'] = {'server': f"http://{self.proxy}"}
+                
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(**launch_options)
+        return self._browser
+    
+    async def scrape(self, url: str, wait_time: int = 20) -> Dict[str, Any]:
+        """
+        Render one URL in a fresh browser context and extract its data.
+        
+        Navigation errors are raised so the caller records them as the
+        URL's failure reason.
+        """
+        async with self._slots:
+            browser = await self._get_browser()
+            context = await browser.new_context(user_agent=USER_AGENT)
+            try:
+                page = await context.new_page()
+                await page.route(PLAYWRIGHT_BLOCKED, lambda route: route.abort())
+                await page.goto(url, wait_until="domcontentloaded", timeout=wait_time * 1000)
+                try:
+                    await page.wait_for_selector(PRODUCT_SELECTORS, state="attached",
+                                                 timeout=wait_time * 1000)
+                except Exception:
+                    pass  # parse whatever has rendered so far
+                html_content = await page.content()
+            finally:
+                await context.close()
+        
+        return await asyncio.to_thread(self.parser.parse_html, html_content, url)
+    
+    async def close(self):
+        """Close the browser and stop Playwright."""
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
 
 
 class BatchScraper:
     """Batch scraper for processing multiple AliExpress URLs."""
     
-    def __init__(self, headless: bool = True, proxy: str = None, rate_limit: float = 5.0):
+    def __init__(self, headless: bool = True, proxy: str = None, rate_limit: float = 5.0,
+                 max_concurrency: int = 64, max_retries: int = 3, wait_time: int = 10,
+                 renderer: str = "playwright"):
         """
         Initialize batch scraper.
         
         Args:
             headless: Whether to run browser in headless mode
             proxy: Optional proxy server
-            rate_limit: Minimum delay between requests (seconds)
+            rate_limit: Minimum delay between requests on each connection (seconds)
+            max_concurrency: Maximum number of page downloads in flight at once
+            max_retries: Retries per URL for transient network/HTTP errors
+            wait_time: Upper bound (seconds) to wait for a browser-rendered page
+            renderer: Browser used for JavaScript pages, "playwright" or "selenium"
         """
         self.headless = headless
         self.proxy = proxy
         self.rate_limit = rate_limit
-        self.scraper = None
-        self.results = []
-        self.failed_urls = []
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.wait_time = wait_time
+        self.renderer = renderer
+        # Download semaphores, created by each scrape_batch() run on its own loop
+        self._global_sem: Optional[asyncio.BoundedSemaphore] = None
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+        self._host_interval: Dict[str, float] = {}
+        self._host_next: Dict[str, float] = {}
+        self.browser_pool = None
         
-    def load_urls_from_file(self, file_path: str, limit: int = None) -> List[str]:
+    def load_urls_from_file(self, file_path: str, limit: int = None) -> Iterator[str]:
         """
-        Load URLs from the JSON file.
+        Stream URLs from the JSON file.
+        
+        Records are parsed one at a time, so the full array is never held
+        in memory and scraping can start before the file is read. URLs are
+        canonicalized and duplicates are skipped.
         
         Args:
             file_path: Path to the URLs file
             limit: Maximum number of URLs to process (None for all)
             
-        Returns:
-            List of URLs to scrape
+        Yields:
+            URLs to scrape
         """
+        count = 0
+        duplicates = 0
+        seen = set()
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            urls = [item['url'] for item in data if 'url' in item]
+            with open(file_path, 'rb') as f:
+                for item in ijson.items(f, 'item'):
+                    if limit and count >= limit:
+                        break
+                    if 'url' not in item:
+                        continue
+                    
+                    url = canonicalize_url(item['url'])
+                    if url in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(url)
+                    
+                    count += 1
+                    yield url
             
-            if limit:
-                urls = urls[:limit]
-                
-            print(f"Loaded {len(urls)} URLs from {file_path}")
-            return urls
+            print(f"Loaded {count} unique URLs from {file_path} ({duplicates} duplicates skipped)")
             
         except Exception as e:
             print(f"Error loading URLs from file: {e}")
-            return []
     
-    def scrape_batch(self, urls: List[str], output_dir: str = "scraped_data") -> Dict[str, Any]:
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        """Return the semaphore limiting concurrent requests to one host."""
+        if host not in self._host_sems:
+            self._host_sems[host] = asyncio.Semaphore(LIMIT_PER_HOST)
+        return self._host_sems[host]
+    
+    def _observe_rate_limit(self, host: str, headers) -> None:
+        """
+        Pace a host's requests to the quota its rate-limit headers advertise.
+        
+        With R requests left and the window resetting in T seconds, requests
+        to the host are spaced T / R apart, and none start before the reset
+        once the quota is used up. Hosts that send no such headers are only
+        slowed by 429 responses and the retry backoff.
+        """
+        remaining = headers.get('X-RateLimit-Remaining') or headers.get('RateLimit-Remaining')
+        window = _parse_rate_reset(headers.get('X-RateLimit-Reset') or headers.get('RateLimit-Reset'))
+        if remaining is None or window is None:
+            return
+        
+        try:
+            remaining = int(remaining.split(',')[0].split(';')[0])
+        except ValueError:
+            return
+        
+        self._host_interval[host] = window / max(remaining, 1)
+        if remaining <= 0:
+            self._host_next[host] = max(self._host_next.get(host, 0.0), time.monotonic() + window)
+    
+    async def _wait_for_host(self, host: str) -> None:
+        """Wait for the host's next request slot when its requests are being paced."""
+        interval = self._host_interval.get(host)
+        if interval is None:
+            return
+        
+        now = time.monotonic()
+        start = max(now, self._host_next.get(host, 0.0))
+        self._host_next[host] = start + interval
+        if start > now:
+            await asyncio.sleep(start - now)
+    
+    async def fetch(self, url: str, session: aiohttp.ClientSession) -> str:
+        """
+        Download the raw HTML of a product page.
+        
+        At most max_concurrency downloads run at once, so a large batch
+        never opens thousands of sockets at the same time. Connection
+        errors, timeouts and 429/5xx responses are retried with exponential
+        backoff, honouring the server's Retry-After header when present, and
+        hosts that advertise a rate-limit quota are paced to stay within it.
+        
+        Args:
+            url: Product URL
+            session: Shared HTTP session
+            
+        Returns:
+            Page HTML as text
+        """
+        proxy = f"http://{self.proxy}" if self.proxy else None
+        host = urlsplit(url).hostname or ''
+        
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            
+            try:
+                await self._wait_for_host(host)
+                async with self._global_sem, self._host_semaphore(host):
+                    async with session.get(url, proxy=proxy) as response:
+                        self._observe_rate_limit(host, response.headers)
+                        if response.status in RETRY_STATUSES:
+                            retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                        response.raise_for_status()
+                        html_content = await response.text()
+                    
+                    # Keep the slot busy for the rate-limit delay so every slot
+                    # still waits between consecutive requests
+                    await asyncio.sleep(self.rate_limit + random.uniform(0, 2))
+                
+                return html_content
+                
+            except aiohttp.ClientResponseError as e:
+                if e.status not in RETRY_STATUSES or attempt == self.max_retries:
+                    raise
+                error = e
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == self.max_retries:
+                    raise
+                error = e
+            
+            if retry_after is None:
+                retry_after = min(MAX_BACKOFF, 2 ** attempt) + random.uniform(0, 1)
+            print(f"Retrying {url} in {retry_after:.1f}s "
+                  f"(attempt {attempt + 2}/{self.max_retries + 1}): {error}")
+            await asyncio.sleep(retry_after)
+    
+    async def _render_with_browser(self, url: str, parser: AliExpressLiveScraper) -> Dict[str, Any]:
+        """Scrape a page that needs JavaScript in a headless browser."""
+        if self.browser_pool is None:
+            if self.renderer == "playwright":
+                try:
+                    import playwright.async_api  # noqa: F401
+                except ImportError:
+                    print("Playwright is not installed, falling back to Selenium")
+                    self.renderer = "selenium"
+            
+            if self.renderer == "playwright":
+                print(f"Starting Playwright ({PLAYWRIGHT_CONTEXTS} concurrent pages) for JavaScript-rendered pages...")
+                self.browser_pool = PlaywrightRenderer(parser, headless=self.headless, proxy=self.proxy)
+            else:
+                print(f"Starting browser pool (up to {BROWSER_POOL_SIZE} browsers) for JavaScript-rendered pages...")
+                self.browser_pool = BrowserPool(BROWSER_POOL_SIZE, headless=self.headless, proxy=self.proxy)
+        return await self.browser_pool.scrape(url, wait_time=self.wait_time)
+    
+    def scrape_batch(self, urls: Iterable[str], output_dir: str = "scraped_data") -> Dict[str, Any]:
         """
         Scrape a batch of URLs with rate limiting and error handling.
         
+        Pages are downloaded concurrently over plain HTTP; a browser is only
+        started for pages whose static HTML does not contain product data.
+        
         Args:
-            urls: List of URLs to scrape
+            urls: URLs to scrape; any iterable, consumed lazily
             output_dir: Directory to save results
             
         Returns:
             Summary of scraping results
         """
+        return asyncio.run(self._scrape_batch_async(urls, output_dir))
+    
+    async def _scrape_batch_async(self, urls: Iterable[str], output_dir: str) -> Dict[str, Any]:
+        """Async implementation of scrape_batch()."""
+        # asyncio.run() gives every scrape_batch() call a new event loop, and
+        # semaphores left over from an earlier run belong to the old one
+        self._global_sem = asyncio.BoundedSemaphore(self.max_concurrency)
+        self._host_sems = {}
+        
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
         
-        # Initialize scraper
-        print("Initializing scraper...")
-        self.scraper = AliExpressLiveScraper(headless=self.headless, proxy=self.proxy)
+        # Parser for statically fetched pages (no browser needed)
+        parser = AliExpressLiveScraper(headless=self.headless, proxy=self.proxy, launch_browser=False)
         
-        total_urls = len(urls)
+        writer = BackgroundJsonWriter()
+        products_path = os.path.join(output_dir, PRODUCTS_FILE)
+        results_path = os.path.join(output_dir, RESULTS_FILE)
+        failures_path = os.path.join(output_dir, FAILURES_FILE)
+        
+        # Streamed URLs are only counted once the input is exhausted
+        total_urls = len(urls) if hasattr(urls, '__len__') else None
         successful = 0
         failed = 0
+        completed = 0
         start_time = datetime.now()
+        start_mono = time.monotonic()
         
-        print(f"Starting batch scraping of {total_urls} URLs...")
-        print(f"Rate limit: {self.rate_limit} seconds between requests")
+        print(f"Starting batch scraping of {total_urls if total_urls is not None else 'streamed'} URLs...")
+        print(f"Rate limit: {self.rate_limit} seconds between requests per connection")
+        print(f"Concurrency: {self.max_concurrency} requests ({LIMIT_PER_HOST} per host)")
         print("-" * 60)
         
-        try:
-            for i, url in enumerate(urls, 1):
-                print(f"\n[{i}/{total_urls}] Processing: {url}")
+        def record(i: int, url: str, product_data: Dict[str, Any] = None, error: str = None):
+            nonlocal successful, failed, completed
+            total = total_urls if total_urls is not None else '?'
+            
+            if product_data and 'basic_info' in product_data:
+                # Hand the result to the writer thread
+                writer.put(products_path, product_data)
+                
+                writer.put(results_path, {
+                    'url': url,
+                    'status': 'success',
+                    'filename': PRODUCTS_FILE,
+                    'scraped_at': datetime.now().isoformat()
+                })
+                
+                successful += 1
+                print(f"[{i}/{total}] ✓ Success - Data queued for {PRODUCTS_FILE}")
                 
+            else:
+                error = error or "No product data extracted"
+                print(f"[{i}/{total}] ✗ Failed: {url}: {error}")
+                writer.put(failures_path, {
+                    'url': url,
+                    'error': error,
+                    'failed_at': datetime.now().isoformat()
+                })
+                failed += 1
+            
+            # Progress update
+            completed += 1
+            if total_urls is None:
+                print(f"Progress: {completed} done | Success: {successful} | Failed: {failed}")
+                return
+            
+            elapsed = time.monotonic() - start_mono
+            avg_time = elapsed / completed
+            remaining = (total_urls - completed) * avg_time
+            
+            print(f"Progress: {completed}/{total_urls} ({completed/total_urls*100:.1f}%) | "
+                  f"Success: {successful} | Failed: {failed} | "
+                  f"ETA: {remaining/60:.1f} min")
+        
+        # Three-stage pipeline joined by bounded queues: downloads keep going
+        # while earlier pages are parsed or rendered in a browser
+        url_queue = asyncio.Queue(maxsize=self.max_concurrency * 2)
+        parse_queue = asyncio.Queue(maxsize=self.max_concurrency * 2)
+        render_queue = asyncio.Queue(maxsize=self.max_concurrency * 2)
+        
+        async def fetch_worker(session: aiohttp.ClientSession):
+            while True:
+                item = await url_queue.get()
+                if item is None:
+                    return
+                i, url = item
                 try:
-                    # Add random delay to avoid detection
-                    delay = self.rate_limit + random.uniform(0, 2)
-                    if i > 1:  # Don't delay on first request
-                        print(f"Waiting {delay:.1f} seconds...")
-                        time.sleep(delay)
-                    
-                    # Scrape the product
-                    product_data = self.scraper.scrape_product(url, wait_time=20)
-                    
-                    if product_data and 'basic_info' in product_data:
-                        # Save individual result
-                        filename = f"product_{i:04d}_{int(time.time())}.json"
-                        filepath = os.path.join(output_dir, filename)
-                        
-                        with open(filepath, 'w', encoding='utf-8') as f:
-                            json.dump(product_data, f, indent=2, ensure_ascii=False)
-                        
-                        self.results.append({
-                            'url': url,
-                            'status': 'success',
-                            'filename': filename,
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                        
-                        successful += 1
-                        print(f"✓ Success - Data saved to {filename}")
-                        
-                    else:
-                        raise Exception("No product data extracted")
-                        
+                    html_content = await self.fetch(url, session)
+                except Exception as e:
+                    record(i, url, error=str(e))
+                    continue
+                await parse_queue.put((i, url, html_content))
+        
+        async def parse_worker():
+            while True:
+                item = await parse_queue.get()
+                if item is None:
+                    return
+                i, url, html_content = item
+                try:
+                    product_data = await asyncio.to_thread(parser.parse_html, html_content, url)
+                except Exception as e:
+                    record(i, url, error=str(e))
+                    continue
+                
+                # Static HTML without a title means the page needs JavaScript
+                if not product_data.get('basic_info', {}).get('title'):
+                    total = total_urls if total_urls is not None else '?'
+                    print(f"[{i}/{total}] No product data in static HTML, using browser: {url}")
+                    await render_queue.put((i, url))
+                else:
+                    record(i, url, product_data)
+        
+        async def render_worker():
+            while True:
+                item = await render_queue.get()
+                if item is None:
+                    return
+                i, url = item
+                try:
+                    record(i, url, await self._render_with_browser(url, parser))
                 except Exception as e:
-                    print(f"✗ Failed: {e}")
-                    self.failed_urls.append({'url': url, 'error': str(e)})
-                    failed += 1
+                    record(i, url, error=str(e))
+        
+        async def run_stage(queue: asyncio.Queue, workers: List[asyncio.Task]):
+            """Signal a stage's workers to stop once its queue drains, then wait for them."""
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers, return_exceptions=True)
+        
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=LIMIT_PER_HOST,
+                                         keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=20)
+        headers = {'User-Agent': USER_AGENT, 'Accept-Language': 'en-US,en;q=0.9'}
+        
+        try:
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                             headers=headers) as session:
+                fetchers = [asyncio.create_task(fetch_worker(session))
+                            for _ in range(self.max_concurrency)]
+                parsers = [asyncio.create_task(parse_worker()) for _ in range(PARSE_WORKERS)]
+                renderers = [asyncio.create_task(render_worker()) for _ in range(RENDER_WORKERS)]
                 
-                # Progress update
-                elapsed = datetime.now() - start_time
-                avg_time = elapsed.total_seconds() / i
-                remaining = (total_urls - i) * avg_time
+                count = 0
+                for count, url in enumerate(urls, 1):
+                    await url_queue.put((count, url))
+                total_urls = count
                 
-                print(f"Progress: {i}/{total_urls} ({i/total_urls*100:.1f}%) | "
-                      f"Success: {successful} | Failed: {failed} | "
-                      f"ETA: {remaining/60:.1f} min")
+                await run_stage(url_queue, fetchers)
+                await run_stage(parse_queue, parsers)
+                await run_stage(render_queue, renderers)
         
         finally:
-            if self.scraper:
-                self.scraper.close()
+            if self.browser_pool:
+                await self.browser_pool.close()
+                self.browser_pool = None
+            # Waiting for the last records to reach disk is off the event loop too
+            await asyncio.to_thread(writer.close)
+        
+        if not total_urls:
+            print("No URLs to process")
         
         # Generate summary
         end_time = datetime.now()
-        duration = end_time - start_time
+        duration = timedelta(seconds=time.monotonic() - start_mono)
         
         summary = {
             'start_time': start_time.isoformat(),
@@ -154,14 +719,14 @@ class BatchScraper:
             'successful': successful,
             'failed': failed,
             'success_rate': (successful / total_urls * 100) if total_urls > 0 else 0,
-            'results': self.results,
-            'failed_urls': self.failed_urls
+            'results_file': results_path,
+            'failures_file': failures_path
         }
         
         # Save summary
         summary_path = os.path.join(output_dir, f"batch_summary_{int(time.time())}.json")
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        with open(summary_path, 'wb') as f:
+            f.write(_dumps(summary, pretty=True))
         
         print(f"\n" + "=" * 60)
         print(f"BATCH SCRAPING COMPLETE")
@@ -177,53 +742,49 @@ class BatchScraper:
 
 def main():
     """Main function for batch scraping."""
-    if len(sys.argv) < 2:
-        print("Usage: python batch_scraper.py <urls_file> [options]")
-        print("Options:")
-        print("  --limit=N          Process only first N URLs")
-        print("  --headless=false   Run browser in non-headless mode")
-        print("  --proxy=host:port  Use proxy server")
-        print("  --rate-limit=N     Delay between requests (seconds, default: 5)")
-        print("  --output=dir       Output directory (default: scraped_data)")
-        return
-    
-    urls_file = sys.argv[1]
-    limit = None
-    headless = True
-    proxy = None
-    rate_limit = 5.0
-    output_dir = "scraped_data"
-    
-    # Parse options
-    for arg in sys.argv[2:]:
-        if arg.startswith('--limit='):
-            limit = int(arg.split('=')[1])
-        elif arg.startswith('--headless='):
-            headless = arg.split('=')[1].lower() == 'true'
-        elif arg.startswith('--proxy='):
-            proxy = arg.split('=')[1]
-        elif arg.startswith('--rate-limit='):
-            rate_limit = float(arg.split('=')[1])
-        elif arg.startswith('--output='):
-            output_dir = arg.split('=')[1]
+    parser = argparse.ArgumentParser(description="Scrape a list of AliExpress URLs in batch.")
+    parser.add_argument('urls_file', help="JSON file with a list of {\"url\": ...} objects")
+    parser.add_argument('--limit', type=int, help="Process only first N URLs")
+    parser.add_argument('--headless', type=lambda s: s.lower() == 'true', default=True,
+                        help="Run browser in headless mode (true/false, default: true)")
+    parser.add_argument('--proxy', help="Use proxy server (host:port)")
+    parser.add_argument('--rate-limit', type=float, default=5.0,
+                        help="Delay between requests (seconds, default: 5)")
+    parser.add_argument('--max-concurrency', type=int, default=64,
+                        help="Maximum parallel downloads (default: 64)")
+    parser.add_argument('--max-retries', type=int, default=3,
+                        help="Retries for failed downloads (default: 3)")
+    parser.add_argument('--wait-time', type=int, default=10,
+                        help="Max wait for browser-rendered pages (seconds, default: 10)")
+    parser.add_argument('--renderer', type=str.lower, choices=['playwright', 'selenium'],
+                        default='playwright', help="Browser for JavaScript pages (default: playwright)")
+    parser.add_argument('--output', default='scraped_data', help="Output directory (default: scraped_data)")
+    args = parser.parse_args()
+    
+    # uvloop is a faster drop-in event loop; it is not available on Windows
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     
     # Initialize batch scraper
     batch_scraper = BatchScraper(
-        headless=headless, 
-        proxy=proxy, 
-        rate_limit=rate_limit
+        headless=args.headless, 
+        proxy=args.proxy, 
+        rate_limit=args.rate_limit,
+        max_concurrency=args.max_concurrency,
+        max_retries=args.max_retries,
+        wait_time=args.wait_time,
+        renderer=args.renderer
     )
     
-    # Load URLs
-    urls = batch_scraper.load_urls_from_file(urls_file, limit=limit)
-    
-    if not urls:
-        print("No URLs to process")
-        return
+    # Load URLs (streamed while scraping)
+    urls = batch_scraper.load_urls_from_file(args.urls_file, limit=args.limit)
     
     # Start batch scraping
     try:
-        summary = batch_scraper.scrape_batch(urls, output_dir)
+        summary = batch_scraper.scrape_batch(urls, args.output)
     except KeyboardInterrupt:
         print("\nBatch scraping interrupted by user")
     except Exception as e:
@@ -8,13 +8,116 @@ including product details, prices, reviews, specifications, images, and more.
 
 import os
 import re
+import glob
+import mmap
 import json
 import sys
-from bs4 import BeautifulSoup
+import functools
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from multiprocessing import Pool
 from urllib.parse import urlparse, parse_qs
 import html
 from typing import Dict, List, Any, Optional
 
+try:
+    import orjson
+except ImportError:  # fall back to the standard library json module
+    orjson = None
+
+
+# Regular expressions, compiled once at import
+_RE_ITEM_ID = re.compile(r'/item/(\d+)\.html')
+_RE_RATING = re.compile(r'(\d+\.\d+)')
+_RE_DIGITS = re.compile(r'(\d+)')
+_RE_REVIEW_INFO = re.compile(r'\w+\s+\|\s+\d+')
+_RE_DELIVERY = re.compile(r'\w{3}\s+\d+\s+-\s+\w{3}\s+\d+')
+_RE_TAX = re.compile(r'Cena bez podatku|bez podatku')
+_RE_FREE_SHIP = re.compile(r'Darmowa dostawa.*PKR')
+
+# Embedded script JSON is located in the raw (mapped) file bytes by these
+# literal markers and sliced out by bracket matching
+_MARK_RUN_PARAMS = b'window.runParams'
+_MARK_IMAGE_LIST = b'"imagePathList":'
+_MARK_SUMM_IMAGE = b'"summImagePathList":'
+_MARK_DC_DATA = b'window._d_c_.DCData'
+_RE_ASSIGN = re.compile(rb'\s*=\s*')
+_RE_SPACE = re.compile(rb'\s*')
+_RE_JSON_TOKEN = re.compile(rb'[\[\]{}"]')
+_RE_STRING_REST = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+
+# OpenGraph properties reported by extract_meta_tags -> output key, in output order
+_OG_MAP = {
+    'og:title': 'og_title',
+    'og:description': 'og_description',
+    'og:image': 'og_image',
+    'og:url': 'og_url',
+    'og:type': 'og_type',
+}
+
+# Individual reviews kept per product
+MAX_REVIEWS = 10
+
+
+def _json_end(buf, start: int) -> int:
+    """
+    Return the offset just past the JSON object/array that opens at start,
+    or -1 if it is not closed. Only brackets and strings are inspected.
+    """
+    depth = 0
+    pos = start
+    while True:
+        token = _RE_JSON_TOKEN.search(buf, pos)
+        if token is None:
+            return -1
+        char = buf[token.start()]
+        if char == 0x22:  # '"': skip the string, including escaped quotes
+            rest = _RE_STRING_REST.match(buf, token.end())
+            if rest is None:
+                return -1
+            pos = rest.end()
+            continue
+        depth += 1 if char in b'[{' else -1
+        if depth == 0:
+            return token.end()
+        pos = token.end()
+
+
+def _cached(method):
+    """Memoise an extract_* result on the instance until the HTML is reloaded."""
+    @functools.wraps(method)
+    def wrapper(self):
+        name = method.__name__
+        if name not in self._cache:
+            self._cache[name] = method(self)
+        return self._cache[name]
+    return wrapper
+
+
+def _loads(data: bytes) -> Any:
+    """Decode JSON with orjson when available, falling back to the json module."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN or oversized integers, which json accepts
+    return json.loads(data)
+
+
+def _only_string(elem) -> Optional[str]:
+    """
+    Return the element's sole string, following a chain of only-children
+    (the semantics of bs4's Tag.string), or None if it has mixed content.
+    """
+    while True:
+        if len(elem) == 0:
+            return elem.text
+        if len(elem) > 1 or elem.text or elem[0].tail:
+            return None
+        elem = elem[0]
+
 
 class AliExpressProductScraper:
     """
@@ -22,38 +125,216 @@ class AliExpressProductScraper:
     Extracts all available product information from HTML content.
     """
     
+    # Section name in the output -> extractor method, in output order
+    SECTIONS = {
+        'basic_info': 'extract_basic_info',
+        'pricing': 'extract_pricing',
+        'reviews_and_ratings': 'extract_reviews_and_ratings',
+        'product_variations': 'extract_product_variations',
+        'images': 'extract_images',
+        'shipping_info': 'extract_shipping_info',
+        'javascript_data': 'extract_javascript_data',
+        'meta_tags': 'extract_meta_tags',
+    }
+    
+    _PARSER = lxml.html.HTMLParser(encoding='utf-8')
+    
+    # Body elements are collected in one walk of the tree and sorted into
+    # roles; the extract_* methods then read their nodes from that index
+    _SEL_SCAN = CSSSelector("h1, span, strong, a, div, img")
+    _CLASS_ROLES = {
+        ('span', 'product-price-value'): 'price',
+        ('span', 'price--currentPriceText--V8_y_b5'): 'price_alt',
+        ('span', 'price--originalPrice'): 'original_price',
+        ('a', 'reviewer--reviews--cx7Zs_V'): 'review_count',
+        ('span', 'reviewer--sold--ytPeoEy'): 'sold',
+        ('div', 'list--itemDesc--JcxNPy5'): 'reviews',
+        ('div', 'sku--wrap--xgoW06M'): 'sku_wrap',
+        ('span', 'sku--menuTitle--UIEMJcG'): 'sku_selection',
+        ('img', 'magnifier--image--EYYoSlr'): 'main_image',
+        ('span', 'delivery-v2--to--Mtweg7y'): 'delivery_to',
+        ('div', 'shipping--item--F04J6q9'): 'shipping_items',
+        ('a', 'store-detail--wrap--IhR4e1j'): 'store_link',
+    }
+    # How many elements to keep per role (default 1, None for all)
+    _ROLE_LIMITS = {'reviews': MAX_REVIEWS, 'shipping_items': None}
+    # Elements whose only string matches a pattern
+    _TEXT_ROLES = {
+        'span': [('tax', _RE_TAX)],
+        'strong': [('rating', _RE_RATING), ('free_shipping', _RE_FREE_SHIP),
+                   ('delivery_time', _RE_DELIVERY)],
+    }
+    
+    # Meta and per-element lookups; compiled once, evaluated in C
+    _XP_TEXT = etree.XPath(".//text()[not(ancestor::script) and not(ancestor::style)]")
+    _XP_META = etree.XPath("//meta[@property]")
+    
+    # Reviewer/date spans, review text and SKU of one review in a single
+    # subtree walk; spans are prefiltered on '|' and confirmed with
+    # _RE_REVIEW_INFO in Python
+    _XP_REVIEW_PARTS = etree.XPath(
+        ".//span[count(node()) = 1 and contains(., '|')]"
+        " | .//div[contains(concat(' ', normalize-space(@class), ' '), ' list--itemReview--d9Z9Z5Z ')]"
+        " | .//div[contains(concat(' ', normalize-space(@class), ' '), ' list--itemSku--idEQSGC ')]"
+    )
+    
+    _SEL_SKU_ITEMS = CSSSelector("div.sku-item--wrap--t9Qszzx")
+    _SEL_SKU_TITLE = CSSSelector("div.sku-item--title--Z0HLO87")
+    _SEL_SKU_OPTIONS = CSSSelector("div[data-sku-col]")
+    _SEL_IMG = CSSSelector("img")
+    
+    _SEL_SHIPPING_TITLE = CSSSelector("div.shipping--title--sZAnuQw")
+    _SEL_SHIPPING_DESC = CSSSelector("div.shipping--descText--UVpscND")
+    
+    _SEL_STORE_NAME = CSSSelector("span.store-detail--storeName--hpOD8R8")
+    
+    # No per-instance __dict__; batch runs create one scraper per file
+    __slots__ = ('html_file_path', 'tree', 'nodes', 'meta_tags', 'meta',
+                 'product_data', '_cache', '_file', '_mm')
+    
     def __init__(self, html_file_path: str):
         """Initialize the scraper with an HTML file."""
         self.html_file_path = html_file_path
-        self.soup = None
+        self.tree = None
+        self.nodes = {}
+        self.meta_tags = []
+        self.meta = {}
+        self._cache = {}
+        self._file = None
+        self._mm = None
         self.product_data = {}
         
     def load_html(self) -> bool:
         """Load and parse the HTML file."""
         try:
-            with open(self.html_file_path, 'r', encoding='utf-8') as file:
-                html_content = file.read()
-            self.soup = BeautifulSoup(html_content, 'html.parser')
+            self.close()
+            
+            # Parse straight from the mapped file pages instead of first
+            # copying the whole document into a Python string; the map
+            # stays open so script JSON can be matched on the raw bytes
+            self._file = open(self.html_file_path, 'rb')
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.tree = lxml.html.parse(self._mm, parser=self._PARSER).getroot()
+            self._cache = {}
+            self.nodes = self._scan_tree()
+            
+            # All <meta property> tags in one pass; first content per property
+            self.meta_tags = self._XP_META(self.tree)
+            self.meta = {}
+            for elem in self.meta_tags:
+                self.meta.setdefault(elem.get('property'), elem.get('content', ''))
             return True
         except Exception as e:
             print(f"Error loading HTML file: {e}")
             return False
     
+    def _scan_tree(self) -> Dict[str, List[Any]]:
+        """Walk the body elements once and index them by the role they play."""
+        nodes = {}
+        
+        def add(role: str, elem):
+            bucket = nodes.setdefault(role, [])
+            limit = self._ROLE_LIMITS.get(role, 1)
+            if limit is None or len(bucket) < limit:
+                bucket.append(elem)
+        
+        for elem in self._SEL_SCAN(self.tree):
+            tag = elem.tag
+            if tag == 'h1':
+                if elem.get('data-pl') == 'product-title':
+                    add('title', elem)
+                continue
+            
+            for token in set(elem.get('class', '').split()):
+                role = self._CLASS_ROLES.get((tag, token))
+                if role:
+                    add(role, elem)
+            
+            if tag == 'span' and 'color: #D3031C' in elem.get('style', ''):
+                add('bulk_price', elem)
+            
+            text_roles = self._TEXT_ROLES.get(tag)
+            if text_roles:
+                string = None
+                for role, pattern in text_roles:
+                    if role in nodes:
+                        continue  # only the first match is used
+                    if string is None:
+                        string = _only_string(elem)
+                        if string is None:
+                            break
+                    if pattern.search(string):
+                        add(role, elem)
+        
+        return nodes
+    
+    def _script_json(self, marker: bytes, assignment: bool = False) -> Any:
+        """
+        Decode the JSON value following marker in the raw file.
+        
+        Args:
+            marker: Literal bytes that precede the value
+            assignment: Whether an '=' separates marker and value (JS variables)
+            
+        Returns:
+            The last occurrence that decodes as valid JSON, or None
+        """
+        data = None
+        buf = self._mm
+        separator = _RE_ASSIGN if assignment else _RE_SPACE
+        
+        pos = buf.find(marker, 0)
+        while pos != -1:
+            start = pos + len(marker)
+            gap = separator.match(buf, start)
+            if gap is not None:
+                start = gap.end()
+                if buf[start:start + 1] in (b'{', b'['):
+                    end = _json_end(buf, start)
+                    if end != -1:
+                        try:
+                            data = _loads(buf[start:end])
+                        except ValueError:
+                            pass
+            pos = buf.find(marker, start)
+        return data
+    
+    def _node(self, role: str):
+        """Return the first element indexed under role, or None."""
+        matches = self.nodes.get(role)
+        return matches[0] if matches else None
+    
+    def _first(self, xpath: etree.XPath, node=None):
+        """Return the first match of a compiled XPath or CSS selector, or None."""
+        matches = xpath(self.tree if node is None else node)
+        return matches[0] if matches else None
+    
+    def _text(self, elem) -> str:
+        """Concatenate the stripped text nodes below elem (like bs4's get_text(strip=True))."""
+        if len(elem) == 0:
+            # Leaf element (title, price, rating, ...): its text is all there is
+            return (elem.text or '').strip()
+        return ''.join(text.strip() for text in self._XP_TEXT(elem))
+    
+    def _meta_content(self, prop: str) -> Optional[str]:
+        """Return the content of the <meta property=prop> tag, or None if absent."""
+        return self.meta.get(prop)
+    
+    @_cached
     def extract_basic_info(self) -> Dict[str, Any]:
         """Extract basic product information."""
         basic_info = {}
         
         try:
             # Product title
-            title_elem = self.soup.find('h1', {'data-pl': 'product-title'})
-            if title_elem:
-                basic_info['title'] = title_elem.get_text(strip=True)
+            title_elem = self._node('title')
+            if title_elem is not None:
+                basic_info['title'] = self._text(title_elem)
             
             # Product ID from URL or meta tags
-            og_url = self.soup.find('meta', {'property': 'og:url'})
-            if og_url:
-                url_content = og_url.get('content', '')
-                match = re.search(r'/item/(\d+)\.html', url_content)
+            url_content = self._meta_content('og:url')
+            if url_content is not None:
+                match = _RE_ITEM_ID.search(url_content)
                 if match:
                     basic_info['product_id'] = match.group(1)
             
@@ -70,92 +351,92 @@ class AliExpressProductScraper:
             
         return basic_info
     
+    @_cached
     def extract_pricing(self) -> Dict[str, Any]:
         """Extract pricing information."""
         pricing = {}
         
         try:
-            # Main price
-            price_elem = self.soup.find('span', class_='product-price-value')
-            if price_elem:
-                pricing['current_price'] = price_elem.get_text(strip=True)
-            
-            # Alternative price selector
-            if not pricing.get('current_price'):
-                price_elem = self.soup.find('span', {'class': 'price--currentPriceText--V8_y_b5'})
-                if price_elem:
-                    pricing['current_price'] = price_elem.get_text(strip=True)
+            # Main price, then the alternative selector only if that is empty
+            for role in ('price', 'price_alt'):
+                price_elem = self._node(role)
+                if price_elem is not None:
+                    pricing['current_price'] = self._text(price_elem)
+                    if pricing['current_price']:
+                        break
             
             # Bulk pricing
-            bulk_price = self.soup.find('span', style=lambda x: x and 'color: #D3031C' in x)
-            if bulk_price and 'za szt' in bulk_price.get_text():
-                pricing['bulk_price'] = bulk_price.get_text(strip=True)
+            bulk_price = self._node('bulk_price')
+            if bulk_price is not None and 'za szt' in bulk_price.text_content():
+                pricing['bulk_price'] = self._text(bulk_price)
             
             # Original price (if on sale)
-            original_price = self.soup.find('span', class_='price--originalPrice')
-            if original_price:
-                pricing['original_price'] = original_price.get_text(strip=True)
+            original_price = self._node('original_price')
+            if original_price is not None:
+                pricing['original_price'] = self._text(original_price)
             
             # Tax information
-            tax_elem = self.soup.find('span', string=re.compile(r'Cena bez podatku|bez podatku'))
-            if tax_elem:
-                pricing['tax_info'] = tax_elem.get_text(strip=True)
+            tax_elem = self._node('tax')
+            if tax_elem is not None:
+                pricing['tax_info'] = self._text(tax_elem)
                 
         except Exception as e:
             print(f"Error extracting pricing: {e}")
             
         return pricing
     
+    @_cached
     def extract_reviews_and_ratings(self) -> Dict[str, Any]:
         """Extract review and rating information."""
         reviews = {}
         
         try:
             # Rating
-            rating_elem = self.soup.find('strong', string=re.compile(r'\d+\.\d+'))
-            if rating_elem:
-                rating_text = rating_elem.get_text(strip=True)
-                match = re.search(r'(\d+\.\d+)', rating_text)
+            rating_elem = self._node('rating')
+            if rating_elem is not None:
+                rating_text = self._text(rating_elem)
+                match = _RE_RATING.search(rating_text)
                 if match:
                     reviews['rating'] = float(match.group(1))
             
             # Review count
-            review_count_elem = self.soup.find('a', class_='reviewer--reviews--cx7Zs_V')
-            if review_count_elem:
-                review_text = review_count_elem.get_text(strip=True)
-                match = re.search(r'(\d+)', review_text)
+            review_count_elem = self._node('review_count')
+            if review_count_elem is not None:
+                review_text = self._text(review_count_elem)
+                match = _RE_DIGITS.search(review_text)
                 if match:
                     reviews['review_count'] = int(match.group(1))
             
             # Sales count
-            sold_elem = self.soup.find('span', class_='reviewer--sold--ytPeoEy')
-            if sold_elem:
-                sold_text = sold_elem.get_text(strip=True)
-                match = re.search(r'(\d+)', sold_text)
+            sold_elem = self._node('sold')
+            if sold_elem is not None:
+                sold_text = self._text(sold_elem)
+                match = _RE_DIGITS.search(sold_text)
                 if match:
                     reviews['sold_count'] = int(match.group(1))
             
             # Individual reviews
-            review_items = self.soup.find_all('div', class_='list--itemDesc--JcxNPy5')
+            review_items = self.nodes.get('reviews', [])
             individual_reviews = []
             
-            for review in review_items[:10]:  # Limit to first 10 reviews
+            for review in review_items:  # Only the first MAX_REVIEWS are indexed
                 review_data = {}
                 
-                # Reviewer and date
-                info_elem = review.find('span', string=re.compile(r'\w+\s+\|\s+\d+'))
-                if info_elem:
-                    review_data['reviewer_info'] = info_elem.get_text(strip=True)
+                parts = {}
+                for elem in self._XP_REVIEW_PARTS(review):
+                    if elem.tag == 'span':
+                        key = 'reviewer_info' if _RE_REVIEW_INFO.search(elem.text_content()) else None
+                    elif 'list--itemReview--d9Z9Z5Z' in elem.get('class', '').split():
+                        key = 'review_text'
+                    else:
+                        key = 'sku'
+                    if key and key not in parts:
+                        parts[key] = elem
                 
-                # Review text
-                review_text_elem = review.find('div', class_='list--itemReview--d9Z9Z5Z')
-                if review_text_elem:
-                    review_data['review_text'] = review_text_elem.get_text(strip=True)
-                
-                # SKU information
-                sku_elem = review.find('div', class_='list--itemSku--idEQSGC')
-                if sku_elem:
-                    review_data['sku'] = sku_elem.get_text(strip=True)
+                # Reviewer and date, review text, SKU information
+                for key in ('reviewer_info', 'review_text', 'sku'):
+                    if key in parts:
+                        review_data[key] = self._text(parts[key])
                 
                 if review_data:
                     individual_reviews.append(review_data)
@@ -168,41 +449,44 @@ class AliExpressProductScraper:
             
         return reviews
     
+    @_cached
     def extract_product_variations(self) -> Dict[str, Any]:
         """Extract product variations and SKU information."""
         variations = {}
         
         try:
             # SKU options
-            sku_wrapper = self.soup.find('div', class_='sku--wrap--xgoW06M')
-            if sku_wrapper:
-                sku_items = sku_wrapper.find_all('div', class_='sku-item--wrap--t9Qszzx')
+            sku_wrapper = self._node('sku_wrap')
+            if sku_wrapper is not None:
+                sku_items = self._SEL_SKU_ITEMS(sku_wrapper)
                 
                 for sku_item in sku_items:
                     # Variation name (e.g., "kolor")
-                    title_elem = sku_item.find('div', class_='sku-item--title--Z0HLO87')
-                    if title_elem:
-                        variation_name = title_elem.get_text(strip=True).replace(':', '')
+                    title_elem = self._first(self._SEL_SKU_TITLE, sku_item)
+                    if title_elem is not None:
+                        variation_name = self._text(title_elem).replace(':', '')
                         
                         # Variation options
                         options = []
-                        option_elems = sku_item.find_all('div', {'data-sku-col': True})
+                        option_elems = self._SEL_SKU_OPTIONS(sku_item)
                         
                         for option in option_elems:
                             option_data = {}
                             
                             # Option image
-                            img = option.find('img')
-                            if img:
+                            img = self._first(self._SEL_IMG, option)
+                            if img is not None:
                                 option_data['image'] = img.get('src', '')
                                 option_data['alt_text'] = img.get('alt', '')
                             
+                            option_classes = option.get('class', '').split()
+                            
                             # Check if option is selected
-                            if 'sku-item--selected--ITGY_EO' in option.get('class', []):
+                            if 'sku-item--selected--ITGY_EO' in option_classes:
                                 option_data['selected'] = True
                             
                             # Check if option is sold out
-                            if 'sku-item--soldOut--YJfuCGq' in option.get('class', []):
+                            if 'sku-item--soldOut--YJfuCGq' in option_classes:
                                 option_data['sold_out'] = True
                             
                             if option_data:
@@ -212,89 +496,78 @@ class AliExpressProductScraper:
                             variations[variation_name] = options
             
             # Current selection
-            current_selection = self.soup.find('span', class_='sku--menuTitle--UIEMJcG')
-            if current_selection:
-                variations['current_selection'] = current_selection.get_text(strip=True)
+            current_selection = self._node('sku_selection')
+            if current_selection is not None:
+                variations['current_selection'] = self._text(current_selection)
                 
         except Exception as e:
             print(f"Error extracting variations: {e}")
             
         return variations
     
+    @_cached
     def extract_images(self) -> Dict[str, Any]:
         """Extract product images."""
         images = {}
         
         try:
             # Main product image
-            main_img = self.soup.find('img', class_='magnifier--image--EYYoSlr')
-            if main_img:
+            main_img = self._node('main_image')
+            if main_img is not None:
                 images['main_image'] = main_img.get('src', '')
             
-            # Gallery images from script tags
-            script_tags = self.soup.find_all('script', string=re.compile(r'imagePathList'))
-            for script in script_tags:
-                script_content = script.get_text()
-                # Extract imagePathList
-                match = re.search(r'"imagePathList":\s*(\[.*?\])', script_content)
-                if match:
-                    try:
-                        image_list = json.loads(match.group(1))
-                        images['gallery_images'] = image_list
-                    except:
-                        pass
-                
-                # Extract thumbnail images
-                match = re.search(r'"summImagePathList":\s*(\[.*?\])', script_content)
-                if match:
-                    try:
-                        thumb_list = json.loads(match.group(1))
-                        images['thumbnail_images'] = thumb_list
-                    except:
-                        pass
+            # Gallery and thumbnail images from the embedded script JSON
+            image_list = self._script_json(_MARK_IMAGE_LIST)
+            if image_list is not None:
+                images['gallery_images'] = image_list
+            
+            thumb_list = self._script_json(_MARK_SUMM_IMAGE)
+            if thumb_list is not None:
+                images['thumbnail_images'] = thumb_list
             
             # OpenGraph image
-            og_image = self.soup.find('meta', {'property': 'og:image'})
-            if og_image:
-                images['og_image'] = og_image.get('content', '')
+            og_image = self._meta_content('og:image')
+            if og_image is not None:
+                images['og_image'] = og_image
                 
         except Exception as e:
             print(f"Error extracting images: {e}")
             
         return images
     
+    @_cached
     def extract_shipping_info(self) -> Dict[str, Any]:
         """Extract shipping and delivery information."""
         shipping = {}
         
         try:
             # Free shipping threshold
-            free_shipping = self.soup.find('strong', string=re.compile(r'Darmowa dostawa.*PKR'))
-            if free_shipping:
-                shipping['free_shipping_threshold'] = free_shipping.get_text(strip=True)
+            free_shipping = self._node('free_shipping')
+            if free_shipping is not None:
+                shipping['free_shipping_threshold'] = self._text(free_shipping)
             
             # Delivery timeframe
-            delivery_elem = self.soup.find('strong', string=re.compile(r'\w{3}\s+\d+\s+-\s+\w{3}\s+\d+'))
-            if delivery_elem:
-                shipping['delivery_time'] = delivery_elem.get_text(strip=True)
+            delivery_elem = self._node('delivery_time')
+            if delivery_elem is not None:
+                shipping['delivery_time'] = self._text(delivery_elem)
             
             # Delivery location
-            delivery_to = self.soup.find('span', class_='delivery-v2--to--Mtweg7y')
-            if delivery_to:
-                shipping['delivery_to'] = delivery_to.get_text(strip=True)
+            delivery_to = self._node('delivery_to')
+            if delivery_to is not None:
+                shipping['delivery_to'] = self._text(delivery_to)
             
             # Shipping policies
-            shipping_items = self.soup.find_all('div', class_='shipping--item--F04J6q9')
+            shipping_items = self.nodes.get('shipping_items', [])
             policies = []
             
             for item in shipping_items:
-                title_elem = item.find('div', class_='shipping--title--sZAnuQw')
-                if title_elem:
-                    policy_title = title_elem.get_text(strip=True)
+                title_elem = self._first(self._SEL_SHIPPING_TITLE, item)
+                if title_elem is not None:
+                    policy_title = self._text(title_elem)
                     
                     # Get policy description if available
-                    desc_elems = item.find_all('div', class_='shipping--descText--UVpscND')
-                    descriptions = [desc.get_text(strip=True) for desc in desc_elems]
+                    desc_elems = self._SEL_SHIPPING_DESC(item)
+                    descriptions = [self._text(desc) for desc in desc_elems]
                     
                     policies.append({
                         'title': policy_title,
@@ -309,20 +582,21 @@ class AliExpressProductScraper:
             
         return shipping
     
+    @_cached
     def extract_store_info(self) -> Dict[str, Any]:
         """Extract store/seller information."""
         store = {}
         
         try:
             # Store link
-            store_link = self.soup.find('a', class_='store-detail--wrap--IhR4e1j')
-            if store_link:
+            store_link = self._node('store_link')
+            if store_link is not None:
                 store['store_url'] = store_link.get('href', '')
                 
                 # Store name
-                store_name = store_link.find('span', class_='store-detail--storeName--hpOD8R8')
-                if store_name:
-                    store['store_name'] = store_name.get_text(strip=True)
+                store_name = self._first(self._SEL_STORE_NAME, store_link)
+                if store_name is not None:
+                    store['store_name'] = self._text(store_name)
             
             # Additional store details can be extracted here
             
@@ -331,6 +605,7 @@ class AliExpressProductScraper:
             
         return store
     
+    @_cached
     def extract_category(self) -> str:
         """Extract product category."""
         try:
@@ -340,52 +615,41 @@ class AliExpressProductScraper:
         except:
             return ""
     
+    @_cached
     def extract_javascript_data(self) -> Dict[str, Any]:
         """Extract structured data from JavaScript variables."""
         js_data = {}
         
         try:
             # Extract runParams
-            script_tags = self.soup.find_all('script', string=re.compile(r'window\.runParams'))
-            for script in script_tags:
-                script_content = script.get_text()
-                match = re.search(r'window\.runParams\s*=\s*({.*?});', script_content, re.DOTALL)
-                if match:
-                    try:
-                        js_data['runParams'] = json.loads(match.group(1))
-                    except:
-                        pass
+            run_params = self._script_json(_MARK_RUN_PARAMS, assignment=True)
+            if run_params is not None:
+                js_data['runParams'] = run_params
             
             # Extract _d_c_ data
-            script_tags = self.soup.find_all('script', string=re.compile(r'window\._d_c_'))
-            for script in script_tags:
-                script_content = script.get_text()
-                match = re.search(r'window\._d_c_\.DCData\s*=\s*({.*?});', script_content, re.DOTALL)
-                if match:
-                    try:
-                        js_data['DCData'] = json.loads(match.group(1))
-                    except:
-                        pass
-                        
+            dc_data = self._script_json(_MARK_DC_DATA, assignment=True)
+            if dc_data is not None:
+                js_data['DCData'] = dc_data
+                
         except Exception as e:
             print(f"Error extracting JavaScript data: {e}")
             
         return js_data
     
+    @_cached
     def extract_meta_tags(self) -> Dict[str, Any]:
         """Extract relevant meta tag information."""
         meta_data = {}
         
         try:
             # OpenGraph tags
-            og_tags = ['og:title', 'og:description', 'og:image', 'og:url', 'og:type']
-            for tag in og_tags:
-                elem = self.soup.find('meta', {'property': tag})
-                if elem:
-                    meta_data[tag.replace(':', '_')] = elem.get('content', '')
+            for prop, key in _OG_MAP.items():
+                content = self.meta.get(prop)
+                if content is not None:
+                    meta_data[key] = content
             
             # App links
-            app_links = self.soup.find_all('meta', {'property': re.compile(r'^al:')})
+            app_links = [elem for elem in self.meta_tags if elem.get('property').startswith('al:')]
             if app_links:
                 meta_data['app_links'] = {}
                 for link in app_links:
@@ -399,36 +663,57 @@ class AliExpressProductScraper:
             
         return meta_data
     
-    def scrape_all(self) -> Dict[str, Any]:
-        """Perform comprehensive scraping of all product data."""
-        if not self.load_html():
+    def scrape_all(self, sections: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Perform comprehensive scraping of product data.
+        
+        Args:
+            sections: Names of the sections to extract (keys of SECTIONS);
+                None extracts all of them
+            
+        Returns:
+            Dictionary with one entry per requested section plus a timestamp
+        """
+        if self.tree is None and not self.load_html():
             return {}
         
         print("Starting comprehensive product scraping...")
         
-        # Extract all information
+        # Only run the extractors the caller asked for
         self.product_data = {
-            'basic_info': self.extract_basic_info(),
-            'pricing': self.extract_pricing(),
-            'reviews_and_ratings': self.extract_reviews_and_ratings(),
-            'product_variations': self.extract_product_variations(),
-            'images': self.extract_images(),
-            'shipping_info': self.extract_shipping_info(),
-            'javascript_data': self.extract_javascript_data(),
-            'meta_tags': self.extract_meta_tags(),
-            'scraping_timestamp': self.get_timestamp()
+            name: getattr(self, self.SECTIONS[name])()
+            for name in (sections or self.SECTIONS)
         }
+        self.product_data['scraping_timestamp'] = self.get_timestamp()
         
         print("Scraping completed successfully!")
         return self.product_data
     
+    def close(self):
+        """Release the memory-mapped HTML file."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
     def get_timestamp(self) -> str:
         """Get current timestamp."""
         from datetime import datetime
         return datetime.now().isoformat()
     
-    def save_to_json(self, output_file: str = None) -> bool:
-        """Save scraped data to JSON file."""
+    def save_to_json(self, output_file: str = None, pretty: bool = False) -> bool:
+        """
+        Save scraped data to JSON file.
+        
+        Args:
+            output_file: Target path (default: <html name>_scraped_data.json)
+            pretty: Indent the output for reading; compact otherwise
+            
+        Returns:
+            True if the file was written
+        """
         if not self.product_data:
             print("No data to save. Run scrape_all() first.")
             return False
@@ -438,8 +723,16 @@ class AliExpressProductScraper:
             output_file = f"{base_name}_scraped_data.json"
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(self.product_data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(self.product_data, option=option))
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    if pretty:
+                        json.dump(self.product_data, f, indent=2, ensure_ascii=False)
+                    else:
+                        json.dump(self.product_data, f, ensure_ascii=False, separators=(',', ':'))
             print(f"Data saved to: {output_file}")
             return True
         except Exception as e:
@@ -494,17 +787,83 @@ class AliExpressProductScraper:
         print("="*60)
 
 
+def scrape_one(html_file: str) -> Dict[str, Any]:
+    """Scrape a single HTML file and return its product data (picklable for worker processes)."""
+    scraper = AliExpressProductScraper(html_file)
+    try:
+        return scraper.scrape_all()
+    finally:
+        scraper.close()
+
+
+def _scrape_to_json(html_file: str, pretty: bool = False) -> tuple:
+    """Worker for batch mode: scrape one file and save it next to the others."""
+    scraper = AliExpressProductScraper(html_file)
+    try:
+        saved = bool(scraper.scrape_all()) and scraper.save_to_json(pretty=pretty)
+    finally:
+        scraper.close()
+    return html_file, saved
+
+
+def find_html_files(target: str) -> List[str]:
+    """Expand a directory or glob pattern into a sorted list of HTML files."""
+    if os.path.isdir(target):
+        target = os.path.join(target, '*.html')
+    return sorted(path for path in glob.glob(target) if os.path.isfile(path))
+
+
+def scrape_many(html_files: List[str], processes: int = None, pretty: bool = False) -> int:
+    """
+    Scrape many HTML files in parallel worker processes.
+    
+    Args:
+        html_files: Paths of the HTML files to scrape
+        processes: Number of worker processes (default: CPU count)
+        pretty: Indent the saved JSON files
+        
+    Returns:
+        Number of files scraped and saved successfully
+    """
+    saved_count = 0
+    with Pool(processes or os.cpu_count()) as pool:
+        # Results are written by the workers; only (path, ok) comes back
+        for html_file, saved in pool.imap_unordered(functools.partial(_scrape_to_json, pretty=pretty),
+                                                     html_files, chunksize=8):
+            if saved:
+                saved_count += 1
+            else:
+                print(f"Failed to scrape data from: {html_file}")
+    return saved_count
+
+
 def main():
     """Main function to demonstrate the scraper."""
+    # --pretty indents the saved JSON; the default is compact
+    pretty = '--pretty' in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != '--pretty']
+    
     # Check if HTML file path is provided
-    if len(sys.argv) < 2:
+    if not args:
         html_file = "aliexpress_full.html"  # Default file
         if not os.path.exists(html_file):
             print("Please provide the path to the HTML file as an argument.")
-            print("Usage: python comprehensive_scraper.py <html_file_path>")
+            print("Usage: python comprehensive_scraper.py <html_file_path | directory | glob> [--pretty]")
             return
     else:
-        html_file = sys.argv[1]
+        html_file = args[0]
+    
+    # A directory or glob pattern scrapes every matching file in parallel
+    if os.path.isdir(html_file) or glob.has_magic(html_file):
+        html_files = find_html_files(html_file)
+        if not html_files:
+            print(f"No HTML files found in: {html_file}")
+            return
+        
+        print(f"Scraping {len(html_files)} HTML files with {os.cpu_count()} processes...")
+        saved_count = scrape_many(html_files, pretty=pretty)
+        print(f"Scraped {saved_count}/{len(html_files)} files successfully")
+        return
     
     if not os.path.exists(html_file):
         print(f"HTML file not found: {html_file}")
@@ -517,13 +876,14 @@ def main():
     
     # Perform scraping
     data = scraper.scrape_all()
+    scraper.close()
     
     if data:
         # Print summary
         scraper.print_summary()
         
         # Save to JSON
-        scraper.save_to_json()
+        scraper.save_to_json(pretty=pretty)
         
         # Print some detailed information
         print(f"\nDetailed data structure:")
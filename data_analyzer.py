@@ -6,33 +6,303 @@ This script analyzes scraped AliExpress data and generates insights,
 statistics, and reports from the collected product information.
 """
 
+import functools
 import json
+import mmap
 import os
+import pickle
 import re
+import string
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterator, Optional, Sequence, Tuple
 from collections import Counter, defaultdict
-import statistics
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # fall back to the standard library json module
+    orjson = None
+
+# Product files at least this large are memory-mapped instead of read
+MMAP_MIN_SIZE = 64 * 1024
+# Below this many files, starting worker processes costs more than it saves
+PARALLEL_LOAD_MIN_FILES = 200
+# Sidecar file in the data directory holding already-parsed product rows
+CACHE_FILE = '.product_cache.pkl'
+CACHE_VERSION = 3
+
+# Regular expressions, compiled once at import
+_RE_WORD = re.compile(r'\b[a-zA-Z]{3,}\b')
+# A price amount in scraped text: digits with optional '.', ',' or space
+# separators, e.g. '12.34', '45,99', '1,542' or '1 234,56'
+_RE_AMOUNT = re.compile(r'\d(?:[\d.,\s]*\d)?')
+
+# Maps ASCII punctuation (except '_', a word character) to spaces so titles
+# can be tokenized with str.split
+_WORD_BREAKS = string.punctuation.replace('_', '')
+_PUNCTUATION_TO_SPACE = str.maketrans(_WORD_BREAKS, ' ' * len(_WORD_BREAKS))
+# ASCII bytes stripped from count text: all but digits, '.' and K/M suffixes
+_NUMBER_JUNK = bytes(b for b in range(128) if chr(b) not in '0123456789.KMkm')
+
+# Fields kept per product for analysis, in _product_row() order
+ROW_FIELDS = ('price', 'currency', 'discount', 'rating', 'reviews', 'sales',
+              'category', 'title', 'brand', 'seller_rating', 'seller_years',
+              'seller_followers', 'seller_name')
+# Label columns of the product table stored with pandas' category dtype
+CATEGORICAL_COLUMNS = ('currency', 'category', 'brand', 'seller_name')
+
+# Range boundaries (lower bound inclusive) and labels for the distributions
+PRICE_BINS = np.array([10, 25, 50, 100, 250], dtype=np.float64)
+PRICE_LABELS = ['$0-10', '$10-25', '$25-50', '$50-100', '$100-250', '$250+']
+RATING_BINS = np.array([2.5, 3.0, 3.5, 4.0, 4.5], dtype=np.float64)
+RATING_LABELS = ['Below 2.5', '2.5-3.0', '3.0-3.5', '3.5-4.0', '4.0-4.5', '4.5-5.0']
+
+# Common stop words to exclude from title keywords
+STOP_WORDS = frozenset({
+    'for', 'and', 'the', 'with', 'to', 'of', 'in', 'on', 'at', 'by', 'is', 'are',
+    'new', 'hot', 'free', 'shipping', 'sale', 'best', 'high', 'quality'
+})
+
+
+def _loads(data):
+    """Decode JSON with orjson when available, falling back to the json module."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN or oversized integers, which json accepts
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _load_json_file(filepath: str) -> Any:
+    """
+    Decode a single JSON file.
+    
+    Files of MMAP_MIN_SIZE bytes or more are memory-mapped and handed to the
+    parser as a view, skipping the copy into a Python buffer; smaller files
+    are read directly, where the mapping setup would cost more than it saves.
+    
+    Args:
+        filepath: Path to the JSON file
+        
+    Returns:
+        Decoded JSON data
+    """
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+            return _loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return _loads(view)
+
+
+def _load_one(filepath: str, keep_raw: bool = False) -> Tuple[List[tuple], List[Any], Optional[str], List[str]]:
+    """
+    Load the products stored in one product_*.json or products*.jsonl file.
+    
+    Each product is reduced to its ROW_FIELDS row as soon as it is parsed,
+    so the full dict is dropped unless keep_raw is set. Runs in worker
+    processes, so read and JSON decode errors are returned rather than
+    raised.
+    
+    Args:
+        filepath: Path to the JSON or JSONL file
+        keep_raw: Also return the full product dicts
+        
+    Returns:
+        Tuple of (product rows, product dicts if keep_raw, error message or
+        None, errors for JSONL lines that were skipped)
+    """
+    try:
+        if filepath.endswith('.jsonl'):
+            # One product per line (batch_scraper output). Lines are decoded
+            # one at a time so a line cut short by a killed run only loses itself
+            rows, products, bad_lines = [], [], []
+            with open(filepath, 'rb') as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        product = _loads(line)
+                    except ValueError as e:
+                        bad_lines.append(f"line {line_number}: {e}")
+                        continue
+                    rows.append(_product_row(product))
+                    if keep_raw:
+                        products.append(product)
+            return rows, products, None, bad_lines
+        product = _load_json_file(filepath)
+        return [_product_row(product)], [product] if keep_raw else [], None, []
+    except (OSError, ValueError) as e:
+        return [], [], str(e), []
+
+
+def _product_row(product: Dict[str, Any]) -> tuple:
+    """
+    Pull the analyzed fields out of a product dict, in ROW_FIELDS order.
+    
+    Values are kept raw (None when missing or empty); numeric conversion
+    happens column-wise when the analysis frame is built.
+    """
+    pricing = product.get('pricing', {})
+    current_price = pricing.get('current_price', {})
+    if not isinstance(current_price, dict):
+        # The scrapers store the price as displayed, e.g. 'US $12.34'
+        current_price = _parse_price(current_price, pricing.get('currency'))
+    reviews_data = product.get('reviews_and_ratings', {})
+    basic_info = product.get('basic_info', {})
+    specs = product.get('specifications', {})
+    seller_info = product.get('seller_info', {})
+    
+    category = basic_info.get('category')
+    brand = specs.get('Brand', specs.get('brand', ''))
+    seller_name = seller_info.get('name', 'Unknown')
+    
+    return (
+        current_price.get('value') or None,
+        current_price.get('currency'),
+        pricing.get('discount_percentage') or None,
+        reviews_data.get('average_rating') or None,
+        reviews_data.get('total_reviews') or None,
+        _extract_number(reviews_data.get('sales_count')) or None,
+        category if category is not None else 'Unknown',
+        basic_info.get('title', ''),
+        brand if brand and brand != 'Unknown' else None,
+        seller_info.get('rating') or None,
+        seller_info.get('years_in_business') or None,
+        _extract_number(seller_info.get('followers')) or None,
+        seller_name if seller_name != 'Unknown' else None
+    )
+
+
+def _parse_price(text: Any, currency: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Split a displayed price such as 'US $12.34', 'zł 45,99' or 'PKR1,542'.
+    
+    The last ',' or '.' marks the decimals unless exactly three digits
+    follow it and the other separator does not appear, as in '1,542' or
+    '1.234.567', where it separates thousands.
+    
+    Args:
+        text: Price text as scraped
+        currency: Currency already known for the price, if any
+        
+    Returns:
+        Dict with 'value' (float, or None if no amount was found) and
+        'currency' (the given currency, else the text around the amount
+        when it holds no digits)
+    """
+    text = str(text) if text else ''
+    match = _RE_AMOUNT.search(text)
+    if not match:
+        return {'value': None, 'currency': currency}
+    
+    amount = ''.join(match.group().split())
+    last = max(amount.rfind('.'), amount.rfind(','))
+    if last >= 0:
+        integer, decimals = amount[:last], amount[last + 1:]
+        other = ',' if amount[last] == '.' else '.'
+        if len(decimals) == 3 and other not in integer:
+            integer, decimals = amount, ''  # '1,542': a thousands separator
+        amount = integer.replace('.', '').replace(',', '')
+        if decimals:
+            amount += '.' + decimals
+    
+    if not currency:
+        rest = (text[:match.start()] + text[match.end():]).strip()
+        currency = rest if rest and not any(c.isdigit() for c in rest) else None
+    return {'value': float(amount), 'currency': currency}
+
+
+def _extract_number(text: str) -> Optional[int]:
+    """Extract number from text (handles K, M suffixes)."""
+    if not text:
+        return None
+    
+    # Remove everything except digits, decimal points and K/M suffixes
+    clean_text = str(text).encode('ascii', 'ignore').translate(None, _NUMBER_JUNK)
+    
+    # Handle K and M suffixes
+    multiplier = 1
+    suffix = clean_text[-1:]
+    if suffix in (b'k', b'K'):
+        multiplier = 1000
+        clean_text = clean_text[:-1]
+    elif suffix in (b'm', b'M'):
+        multiplier = 1000000
+        clean_text = clean_text[:-1]
+    
+    try:
+        return int(float(clean_text) * multiplier)
+    except ValueError:
+        return None
+
+
+def _title_words(title: str) -> Iterator[str]:
+    """
+    Yield the lowercase words of 3+ ASCII letters in a product title.
+    
+    Splits on whitespace and ASCII punctuation and checks tokens with
+    str.isalpha; only tokens containing non-ASCII characters (where word
+    boundaries need Unicode rules) go through the regex.
+    """
+    for word in title.lower().translate(_PUNCTUATION_TO_SPACE).split():
+        if word.isascii():
+            if len(word) >= 3 and word.isalpha():
+                yield word
+        else:
+            yield from _RE_WORD.findall(word)
+
+
+def _to_numeric(values: Sequence[Any], percent: bool = False) -> pd.Series:
+    """
+    Convert a column of raw JSON values to float64 in one vectorized call.
+    
+    Args:
+        values: Raw values (numbers, numeric strings or None)
+        percent: Strip '%' signs from strings before converting
+        
+    Returns:
+        Float Series with NaN where a value is missing or not a number
+    """
+    series = pd.Series(values, dtype=object)
+    if percent:
+        series = series.astype(str).str.replace('%', '', regex=False)
+    return pd.to_numeric(series, errors='coerce').astype(np.float64)
 
 
 class AliExpressDataAnalyzer:
     """Analyzer for scraped AliExpress product data."""
     
-    def __init__(self, data_dir: str):
+    def __init__(self, data_dir: str, use_cache: bool = True, keep_raw: bool = False):
         """
         Initialize analyzer with data directory.
         
         Args:
             data_dir: Directory containing scraped JSON files
+            use_cache: Reuse products parsed on a previous run for files
+                whose modification time and size are unchanged
+            keep_raw: Keep every full product dict in self.products; by
+                default only the analyzed fields are retained
         """
         self.data_dir = data_dir
+        self.use_cache = use_cache
+        self.keep_raw = keep_raw
         self.products = []
+        self.rows = []
+        self.frame = None
         self.analysis_results = {}
     
     def load_scraped_data(self) -> int:
         """
-        Load all scraped product data from JSON files.
+        Load all scraped product data from product_*.json files and
+        products*.jsonl files (one product per line).
         
         Returns:
             Number of products loaded
@@ -41,111 +311,160 @@ class AliExpressDataAnalyzer:
             print(f"Data directory not found: {self.data_dir}")
             return 0
         
-        json_files = [f for f in os.listdir(self.data_dir) if f.endswith('.json') and f.startswith('product_')]
+        with os.scandir(self.data_dir) as entries:
+            json_files = [entry for entry in entries
+                          if entry.name.startswith('product')
+                          and entry.name.endswith(('.json', '.jsonl'))
+                          and entry.is_file()]
         
         print(f"Loading data from {len(json_files)} JSON files...")
         
-        for filename in json_files:
-            filepath = os.path.join(self.data_dir, filename)
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    product_data = json.load(f)
-                    self.products.append(product_data)
-            except Exception as e:
-                print(f"Error loading {filename}: {e}")
+        cache_path = os.path.join(self.data_dir, CACHE_FILE)
+        cache = self._read_cache(cache_path) if self.use_cache else {}
+        
+        # Only files that changed since the cache was written are parsed again;
+        # the cache holds rows, so full dicts always come from parsing
+        parsed = {}
+        stale = []
+        errors = []
+        reused = 0
+        for entry in json_files:
+            stat = entry.stat()
+            if stat.st_size == 0:
+                errors.append((entry.name, 'empty file'))
+                continue
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = cache.get(entry.name)
+            if cached is not None and cached[0] == signature and not self.keep_raw:
+                parsed[entry.name] = cached
+                reused += 1
+            else:
+                stale.append((entry, signature))
+        
+        changed = False
+        raw = {}
+        filepaths = [entry.path for entry, _ in stale]
+        load_one = functools.partial(_load_one, keep_raw=self.keep_raw)
+        if len(filepaths) >= PARALLEL_LOAD_MIN_FILES:
+            # Parsing is CPU-bound and independent per file
+            with ProcessPoolExecutor() as executor:
+                loaded = list(executor.map(load_one, filepaths, chunksize=64))
+        else:
+            loaded = [load_one(filepath) for filepath in filepaths]
+        
+        bad_lines = []
+        for (entry, signature), (rows, products, error, skipped) in zip(stale, loaded):
+            bad_lines.extend((entry.name, message) for message in skipped)
+            if error is not None:
+                errors.append((entry.name, error))
+            else:
+                parsed[entry.name] = (signature, rows)
+                raw[entry.name] = products
+                changed = True
+        
+        for entry in json_files:
+            if entry.name in parsed:
+                self.rows.extend(parsed[entry.name][1])
+                self.products.extend(raw.get(entry.name, ()))
+        self.frame = None
+        
+        if self.use_cache and (changed or parsed.keys() != cache.keys()):
+            self._write_cache(cache_path, parsed)
+        
+        # Reported once after loading rather than interleaved with parsing
+        if errors:
+            print(f"Skipped {len(errors)} unreadable files:\n"
+                  + "\n".join(f"  {name}: {error}" for name, error in sorted(errors)))
+        if bad_lines:
+            print(f"Skipped {len(bad_lines)} unreadable lines:\n"
+                  + "\n".join(f"  {name} {message}" for name, message in bad_lines))
+        
+        print(f"Loaded {len(self.rows)} products successfully"
+              + (f" ({reused} files from cache)" if reused else ""))
+        return len(self.rows)
+    
+    def _read_cache(self, cache_path: str) -> Dict[str, Tuple[Tuple[int, int], List[Any]]]:
+        """
+        Read the parsed-rows cache written by a previous run.
+        
+        Args:
+            cache_path: Path to the cache file
+            
+        Returns:
+            Mapping of file name to ((mtime_ns, size), product rows), empty if the
+            cache is missing, unreadable or from another cache version
+        """
+        try:
+            with open(cache_path, 'rb') as f:
+                cache = pickle.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Ignoring unreadable cache {cache_path}: {e}")
+            return {}
+        
+        if not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION:
+            return {}
+        return cache['files']
+    
+    def _write_cache(self, cache_path: str, files: Dict[str, Tuple[Tuple[int, int], List[Any]]]):
+        """
+        Write the parsed-rows cache, replacing the old one atomically.
         
-        print(f"Loaded {len(self.products)} products successfully")
-        return len(self.products)
+        Args:
+            cache_path: Path to the cache file
+            files: Mapping of file name to ((mtime_ns, size), product rows)
+        """
+        temp_path = cache_path + '.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                pickle.dump({'version': CACHE_VERSION, 'files': files}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            print(f"Error writing cache {cache_path}: {e}")
     
     def analyze_pricing(self) -> Dict[str, Any]:
         """Analyze pricing data across all products."""
-        prices = []
-        currencies = Counter()
-        discount_data = []
-        
-        for product in self.products:
-            pricing = product.get('pricing', {})
-            
-            # Extract current price
-            current_price = pricing.get('current_price', {})
-            if current_price.get('value'):
-                try:
-                    price_value = float(current_price['value'])
-                    prices.append(price_value)
-                    currencies[current_price.get('currency', 'Unknown')] += 1
-                except (ValueError, TypeError):
-                    pass
-            
-            # Extract discount information
-            discount = pricing.get('discount_percentage')
-            if discount:
-                try:
-                    discount_value = float(discount.replace('%', ''))
-                    discount_data.append(discount_value)
-                except (ValueError, TypeError):
-                    pass
+        frame = self._get_frame()
+        priced = frame['price'].notna()
+        prices = frame['price'].to_numpy()[priced.to_numpy()]
+        discount_data = frame['discount'].dropna().to_numpy()
         
         analysis = {
             'total_products_with_pricing': len(prices),
             'price_statistics': {},
-            'currency_distribution': dict(currencies),
+            # Most common first, like the other distributions
+            'currency_distribution': frame['currency'][priced].value_counts().to_dict(),
             'discount_statistics': {}
         }
         
-        if prices:
+        if prices.size:
             analysis['price_statistics'] = {
-                'min_price': min(prices),
-                'max_price': max(prices),
-                'average_price': statistics.mean(prices),
-                'median_price': statistics.median(prices),
+                'min_price': float(prices.min()),
+                'max_price': float(prices.max()),
+                'average_price': float(prices.mean()),
+                'median_price': float(np.median(prices)),
                 'price_ranges': self._categorize_prices(prices)
             }
         
-        if discount_data:
+        if discount_data.size:
             analysis['discount_statistics'] = {
-                'min_discount': min(discount_data),
-                'max_discount': max(discount_data),
-                'average_discount': statistics.mean(discount_data),
+                'min_discount': float(discount_data.min()),
+                'max_discount': float(discount_data.max()),
+                'average_discount': float(discount_data.mean()),
                 'products_with_discount': len(discount_data),
-                'discount_percentage': len(discount_data) / len(self.products) * 100
+                'discount_percentage': len(discount_data) / len(frame) * 100
             }
         
         return analysis
     
     def analyze_ratings_and_reviews(self) -> Dict[str, Any]:
         """Analyze ratings and review data."""
-        ratings = []
-        review_counts = []
-        sales_counts = []
-        
-        for product in self.products:
-            reviews_data = product.get('reviews_and_ratings', {})
-            
-            # Extract rating
-            if reviews_data.get('average_rating'):
-                try:
-                    rating = float(reviews_data['average_rating'])
-                    ratings.append(rating)
-                except (ValueError, TypeError):
-                    pass
-            
-            # Extract review count
-            if reviews_data.get('total_reviews'):
-                try:
-                    review_count = int(reviews_data['total_reviews'])
-                    review_counts.append(review_count)
-                except (ValueError, TypeError):
-                    pass
-            
-            # Extract sales count
-            if reviews_data.get('sales_count'):
-                try:
-                    sales_text = reviews_data['sales_count']
-                    sales_num = self._extract_number_from_text(sales_text)
-                    if sales_num:
-                        sales_counts.append(sales_num)
-                except (ValueError, TypeError):
-                    pass
+        frame = self._get_frame()
+        ratings = frame['rating'].dropna().to_numpy()
+        review_counts = frame['reviews'].dropna().to_numpy()
+        sales_counts = frame['sales'].dropna().to_numpy()
         
         analysis = {
             'rating_statistics': {},
@@ -154,74 +473,57 @@ class AliExpressDataAnalyzer:
             'quality_indicators': {}
         }
         
-        if ratings:
+        if ratings.size:
             analysis['rating_statistics'] = {
                 'total_products_with_ratings': len(ratings),
-                'average_rating': statistics.mean(ratings),
-                'median_rating': statistics.median(ratings),
+                'average_rating': float(ratings.mean()),
+                'median_rating': float(np.median(ratings)),
                 'rating_distribution': self._categorize_ratings(ratings)
             }
         
-        if review_counts:
+        if review_counts.size:
             analysis['review_statistics'] = {
                 'total_products_with_reviews': len(review_counts),
-                'average_reviews': statistics.mean(review_counts),
-                'median_reviews': statistics.median(review_counts),
-                'max_reviews': max(review_counts),
-                'min_reviews': min(review_counts)
+                'average_reviews': float(review_counts.mean()),
+                'median_reviews': float(np.median(review_counts)),
+                'max_reviews': int(review_counts.max()),
+                'min_reviews': int(review_counts.min())
             }
         
-        if sales_counts:
+        if sales_counts.size:
             analysis['sales_statistics'] = {
                 'total_products_with_sales': len(sales_counts),
-                'average_sales': statistics.mean(sales_counts),
-                'median_sales': statistics.median(sales_counts),
-                'max_sales': max(sales_counts),
-                'min_sales': min(sales_counts)
+                'average_sales': float(sales_counts.mean()),
+                'median_sales': float(np.median(sales_counts)),
+                'max_sales': int(sales_counts.max()),
+                'min_sales': int(sales_counts.min())
             }
         
         # Quality indicators
-        high_rated = len([r for r in ratings if r >= 4.0])
-        well_reviewed = len([r for r in review_counts if r >= 100])
+        high_rated = int(np.count_nonzero(ratings >= 4.0))
+        well_reviewed = int(np.count_nonzero(review_counts >= 100))
         
         analysis['quality_indicators'] = {
             'high_rated_products': high_rated,
-            'high_rated_percentage': (high_rated / len(ratings) * 100) if ratings else 0,
+            'high_rated_percentage': (high_rated / len(ratings) * 100) if ratings.size else 0,
             'well_reviewed_products': well_reviewed,
-            'well_reviewed_percentage': (well_reviewed / len(review_counts) * 100) if review_counts else 0
+            'well_reviewed_percentage': (well_reviewed / len(review_counts) * 100) if review_counts.size else 0
         }
         
         return analysis
     
     def analyze_categories_and_products(self) -> Dict[str, Any]:
         """Analyze product categories and types."""
-        categories = Counter()
-        brands = Counter()
-        product_titles = []
-        
-        for product in self.products:
-            basic_info = product.get('basic_info', {})
-            
-            # Extract category information
-            category = basic_info.get('category', 'Unknown')
-            categories[category] += 1
-            
-            # Extract brand information (from title or specifications)
-            title = basic_info.get('title', '')
-            product_titles.append(title)
-            
-            # Try to extract brand from specifications
-            specs = product.get('specifications', {})
-            brand = specs.get('Brand', specs.get('brand', ''))
-            if brand and brand != 'Unknown':
-                brands[brand] += 1
+        frame = self._get_frame()
+        categories = frame['category'].value_counts()
+        brands = frame['brand'].value_counts()
         
         # Analyze common keywords in titles
-        keywords = self._extract_common_keywords(product_titles)
+        keywords = self._extract_common_keywords(frame['title'])
         
         return {
-            'category_distribution': dict(categories.most_common(20)),
-            'brand_distribution': dict(brands.most_common(20)),
+            'category_distribution': categories.head(20).to_dict(),
+            'brand_distribution': brands.head(20).to_dict(),
             'common_keywords': keywords,
             'total_categories': len(categories),
             'total_brands': len(brands)
@@ -229,88 +531,115 @@ class AliExpressDataAnalyzer:
     
     def analyze_seller_data(self) -> Dict[str, Any]:
         """Analyze seller information and performance."""
-        seller_ratings = []
-        seller_years = []
-        seller_followers = []
-        top_sellers = Counter()
-        
-        for product in self.products:
-            seller_info = product.get('seller_info', {})
-            
-            # Extract seller rating
-            if seller_info.get('rating'):
-                try:
-                    rating = float(seller_info['rating'].replace('%', ''))
-                    seller_ratings.append(rating)
-                except (ValueError, TypeError):
-                    pass
-            
-            # Extract seller years
-            if seller_info.get('years_in_business'):
-                try:
-                    years = int(seller_info['years_in_business'])
-                    seller_years.append(years)
-                except (ValueError, TypeError):
-                    pass
-            
-            # Extract followers
-            if seller_info.get('followers'):
-                try:
-                    followers = self._extract_number_from_text(seller_info['followers'])
-                    if followers:
-                        seller_followers.append(followers)
-                except (ValueError, TypeError):
-                    pass
-            
-            # Count top sellers
-            seller_name = seller_info.get('name', 'Unknown')
-            if seller_name != 'Unknown':
-                top_sellers[seller_name] += 1
+        frame = self._get_frame()
+        seller_ratings = frame['seller_rating'].dropna()
+        seller_years = frame['seller_years'].dropna()
+        seller_followers = frame['seller_followers'].dropna()
         
         analysis = {
             'seller_rating_statistics': {},
             'seller_experience_statistics': {},
             'seller_popularity_statistics': {},
-            'top_sellers': dict(top_sellers.most_common(10))
+            'top_sellers': frame['seller_name'].value_counts().head(10).to_dict()
         }
         
-        if seller_ratings:
+        if len(seller_ratings):
+            stats = seller_ratings.agg(['mean', 'median'])
             analysis['seller_rating_statistics'] = {
-                'average_seller_rating': statistics.mean(seller_ratings),
-                'median_seller_rating': statistics.median(seller_ratings),
-                'high_rated_sellers': len([r for r in seller_ratings if r >= 95.0])
+                'average_seller_rating': float(stats['mean']),
+                'median_seller_rating': float(stats['median']),
+                'high_rated_sellers': int((seller_ratings >= 95.0).sum())
             }
         
-        if seller_years:
+        if len(seller_years):
+            stats = seller_years.agg(['mean', 'median'])
             analysis['seller_experience_statistics'] = {
-                'average_years_in_business': statistics.mean(seller_years),
-                'median_years_in_business': statistics.median(seller_years),
-                'experienced_sellers': len([y for y in seller_years if y >= 5])
+                'average_years_in_business': float(stats['mean']),
+                'median_years_in_business': float(stats['median']),
+                'experienced_sellers': int((seller_years >= 5).sum())
             }
         
-        if seller_followers:
+        if len(seller_followers):
+            stats = seller_followers.agg(['mean', 'median'])
             analysis['seller_popularity_statistics'] = {
-                'average_followers': statistics.mean(seller_followers),
-                'median_followers': statistics.median(seller_followers),
-                'popular_sellers': len([f for f in seller_followers if f >= 1000])
+                'average_followers': float(stats['mean']),
+                'median_followers': float(stats['median']),
+                'popular_sellers': int((seller_followers >= 1000).sum())
             }
         
         return analysis
     
+    def _get_frame(self) -> pd.DataFrame:
+        """Return the flattened product table, building it on first use."""
+        if self.frame is None:
+            self.frame = self._build_frame()
+        return self.frame
+    
+    def _build_frame(self) -> pd.DataFrame:
+        """
+        Build the analysis table from the loaded product rows.
+        
+        Every analysis reads the same handful of fields, which were pulled
+        out of each product while loading; here they become typed columns
+        (NaN/None where a field is missing or invalid), so all analyses work
+        on whole columns.
+        
+        Returns:
+            DataFrame with one column per ROW_FIELDS entry
+        """
+        if self.rows:
+            columns = dict(zip(ROW_FIELDS, zip(*self.rows)))
+        else:
+            columns = {name: () for name in ROW_FIELDS}
+        
+        price = _to_numeric(columns['price'])
+        # Currencies only count for products with a usable price
+        currency = pd.Series(columns['currency'], dtype=object).fillna('Unknown').where(price.notna())
+        
+        frame = pd.DataFrame({
+            'price': price,
+            'currency': currency,
+            'discount': _to_numeric(columns['discount'], percent=True),
+            'rating': _to_numeric(columns['rating']),
+            'reviews': _to_numeric(columns['reviews']),
+            'sales': _to_numeric(columns['sales']),
+            'category': pd.Series(columns['category'], dtype=object),
+            'title': pd.Series(columns['title'], dtype=object),
+            'brand': pd.Series(columns['brand'], dtype=object),
+            'seller_rating': _to_numeric(columns['seller_rating'], percent=True),
+            'seller_years': _to_numeric(columns['seller_years']),
+            'seller_followers': _to_numeric(columns['seller_followers']),
+            'seller_name': pd.Series(columns['seller_name'], dtype=object)
+        })
+        # Few distinct labels repeated across many rows
+        for name in CATEGORICAL_COLUMNS:
+            frame[name] = frame[name].astype('category')
+        return frame
+    
     def generate_comprehensive_report(self) -> Dict[str, Any]:
         """Generate a comprehensive analysis report."""
         print("Generating comprehensive analysis report...")
         
+        # Build the shared table once, then run the analyses side by side;
+        # NumPy and pandas release the GIL inside their column operations
+        self._get_frame()
+        analyses = {
+            'pricing_analysis': self.analyze_pricing,
+            'ratings_and_reviews_analysis': self.analyze_ratings_and_reviews,
+            'categories_and_products_analysis': self.analyze_categories_and_products,
+            'seller_analysis': self.analyze_seller_data
+        }
+        with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+            futures = {key: executor.submit(analysis) for key, analysis in analyses.items()}
+            results = {key: future.result() for key, future in futures.items()}
+        
         self.analysis_results = {
             'metadata': {
                 'analysis_date': datetime.now().isoformat(),
-                'total_products_analyzed': len(self.products),
+                'total_products_analyzed': len(self.rows),
                 'data_directory': self.data_dir
             },
-            'pricing_analysis': self.analyze_pricing(),
-            'ratings_and_reviews_analysis': self.analyze_ratings_and_reviews(),
-            'categories_and_products_analysis': self.analyze_categories_and_products(),
-            'seller_analysis': self.analyze_seller_data()
+            **results
         }
         
         return self.analysis_results
@@ -321,8 +650,13 @@ class AliExpressDataAnalyzer:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = f"analysis_report_{timestamp}.json"
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(self.analysis_results, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(self.analysis_results, option=option))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(self.analysis_results, f, indent=2, ensure_ascii=False)
         
         print(f"Analysis report saved to: {output_file}")
         return output_file
@@ -348,7 +682,8 @@ class AliExpressDataAnalyzer:
             print(f"\nPRICING:")
             print(f"  Average Price: ${stats['average_price']:.2f}")
             print(f"  Price Range: ${stats['min_price']:.2f} - ${stats['max_price']:.2f}")
-            print(f"  Most Common Currency: {max(pricing['currency_distribution'], key=pricing['currency_distribution'].get)}")
+            # Distributions are ordered most common first
+            print(f"  Most Common Currency: {next(iter(pricing['currency_distribution']), 'N/A')}")
         
         # Ratings summary
         ratings = self.analysis_results['ratings_and_reviews_analysis']
@@ -363,108 +698,54 @@ class AliExpressDataAnalyzer:
         print(f"\nCATEGORIES:")
         print(f"  Total Categories: {categories['total_categories']}")
         print(f"  Total Brands: {categories['total_brands']}")
-        top_category = max(categories['category_distribution'], key=categories['category_distribution'].get)
+        top_category = next(iter(categories['category_distribution']), 'N/A')
         print(f"  Most Common Category: {top_category}")
         
         print("=" * 60)
     
-    def _categorize_prices(self, prices: List[float]) -> Dict[str, int]:
+    def _categorize_prices(self, prices: np.ndarray) -> Dict[str, int]:
         """Categorize prices into ranges."""
-        ranges = {
-            '$0-10': 0, '$10-25': 0, '$25-50': 0, 
-            '$50-100': 0, '$100-250': 0, '$250+': 0
-        }
-        
-        for price in prices:
-            if price < 10:
-                ranges['$0-10'] += 1
-            elif price < 25:
-                ranges['$10-25'] += 1
-            elif price < 50:
-                ranges['$25-50'] += 1
-            elif price < 100:
-                ranges['$50-100'] += 1
-            elif price < 250:
-                ranges['$100-250'] += 1
-            else:
-                ranges['$250+'] += 1
-        
-        return ranges
+        # Bin i holds prices in [PRICE_BINS[i-1], PRICE_BINS[i])
+        counts = np.bincount(np.searchsorted(PRICE_BINS, prices, side='right'),
+                             minlength=len(PRICE_LABELS))
+        return dict(zip(PRICE_LABELS, counts.tolist()))
     
-    def _categorize_ratings(self, ratings: List[float]) -> Dict[str, int]:
+    def _categorize_ratings(self, ratings: np.ndarray) -> Dict[str, int]:
         """Categorize ratings into ranges."""
-        ranges = {
-            '4.5-5.0': 0, '4.0-4.5': 0, '3.5-4.0': 0, 
-            '3.0-3.5': 0, '2.5-3.0': 0, 'Below 2.5': 0
-        }
-        
-        for rating in ratings:
-            if rating >= 4.5:
-                ranges['4.5-5.0'] += 1
-            elif rating >= 4.0:
-                ranges['4.0-4.5'] += 1
-            elif rating >= 3.5:
-                ranges['3.5-4.0'] += 1
-            elif rating >= 3.0:
-                ranges['3.0-3.5'] += 1
-            elif rating >= 2.5:
-                ranges['2.5-3.0'] += 1
-            else:
-                ranges['Below 2.5'] += 1
-        
-        return ranges
+        counts = np.bincount(np.searchsorted(RATING_BINS, ratings, side='right'),
+                             minlength=len(RATING_LABELS))
+        # Report the highest range first
+        return dict(zip(reversed(RATING_LABELS), reversed(counts.tolist())))
     
     def _extract_number_from_text(self, text: str) -> Optional[int]:
         """Extract number from text (handles K, M suffixes)."""
-        if not text:
-            return None
-        
-        # Remove non-alphanumeric except decimal points
-        clean_text = re.sub(r'[^\d.KMkm]', '', str(text))
-        
-        # Handle K and M suffixes
-        multiplier = 1
-        if clean_text.lower().endswith('k'):
-            multiplier = 1000
-            clean_text = clean_text[:-1]
-        elif clean_text.lower().endswith('m'):
-            multiplier = 1000000
-            clean_text = clean_text[:-1]
-        
-        try:
-            return int(float(clean_text) * multiplier)
-        except ValueError:
-            return None
+        return _extract_number(text)
     
     def _extract_common_keywords(self, titles: List[str], top_n: int = 20) -> Dict[str, int]:
         """Extract common keywords from product titles."""
-        # Common stop words to exclude
-        stop_words = {
-            'for', 'and', 'the', 'with', 'to', 'of', 'in', 'on', 'at', 'by', 'is', 'are',
-            'new', 'hot', 'free', 'shipping', 'sale', 'best', 'high', 'quality'
-        }
-        
-        all_words = []
+        keywords = Counter()
         for title in titles:
             if title:
-                # Extract words, convert to lowercase, remove special characters
-                words = re.findall(r'\b[a-zA-Z]{3,}\b', title.lower())
-                all_words.extend([w for w in words if w not in stop_words])
+                keywords.update(w for w in _title_words(title) if w not in STOP_WORDS)
         
-        return dict(Counter(all_words).most_common(top_n))
+        return dict(keywords.most_common(top_n))
 
 
 def main():
     """Main function for data analysis."""
     if len(sys.argv) < 2:
-        print("Usage: python data_analyzer.py <data_directory> [output_file]")
+        print("Usage: python data_analyzer.py <data_directory> [output_file] [--no-cache] [--keep-raw]")
         return
     
-    data_dir = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
+    use_cache = '--no-cache' not in sys.argv
+    keep_raw = '--keep-raw' in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg not in ('--no-cache', '--keep-raw')]
+    
+    data_dir = args[0]
+    output_file = args[1] if len(args) > 1 else None
     
     # Initialize analyzer
-    analyzer = AliExpressDataAnalyzer(data_dir)
+    analyzer = AliExpressDataAnalyzer(data_dir, use_cache=use_cache, keep_raw=keep_raw)
     
     # Load data
     products_loaded = analyzer.load_scraped_data()
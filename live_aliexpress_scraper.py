@@ -7,13 +7,25 @@ data extraction from AliExpress product pages. It scrapes the page in real-time
 and extracts all available product information.
 """
 
-import time
 import json
+import base64
+import functools
+import itertools
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # fall back to the standard library json module
+    orjson = None
+
 # Selenium imports
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -21,32 +33,380 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 
-# BeautifulSoup for HTML parsing
-from bs4 import BeautifulSoup
+# lxml for HTML parsing and CSS selection
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
 import html
 
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Upper bound, in seconds, for SCROLL_AND_SETTLE
+SETTLE_TIMEOUT = 10
+
+# Scroll to the bottom and resolve once lazy-loaded modules have stopped
+# changing the DOM for 500 ms (bounded by the script timeout)
+SCROLL_AND_SETTLE = """
+const done = arguments[arguments.length - 1];
+let timer = setTimeout(finish, 500);
+const observer = new MutationObserver(() => {
+    clearTimeout(timer);
+    timer = setTimeout(finish, 500);
+});
+function finish() { observer.disconnect(); done(true); }
+observer.observe(document.body, {childList: true, subtree: true});
+window.scrollTo(0, document.body.scrollHeight);
+"""
+
+# Plain-HTTP fetches for scrape_product_fast()
+HTTP_HEADERS = {'User-Agent': USER_AGENT, 'Accept-Language': 'en-US,en;q=0.9'}
+HTTP_POOL_SIZE = 16
+HTTP_TIMEOUT = 15
+
+# save_to_json writes compact JSON when the indented form exceeds this size (bytes)
+PRETTY_JSON_LIMIT = 50 * 1024 * 1024
+
+# Requests Chrome never needs to make: only the HTML and inline JSON are scraped
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.mp4",
+    "*.woff*", "*.css", "*/analytics/*", "*/gtag/*",
+    # third-party trackers and ads, and Alibaba's own logging beacons
+    "*doubleclick.net*", "*google-analytics.com*", "*criteo*", "*/alilog/*"
+]
+
+# Regular expressions, compiled once at import
+_RE_ITEM_ID = re.compile(r'/item/(\d+)\.html')
+_RE_PRODUCT_ID = re.compile(r'productId["\']?\s*:\s*["\']?(\d+)')
+_RE_DIGITS = re.compile(r'(\d+)')
+_RE_DECIMAL = re.compile(r'(\d+\.\d+)')
+_RE_NUMBER = re.compile(r'(\d+(?:\.\d+)?)')
+_RE_RUN_PARAMS = re.compile(r'window\.runParams\s*=')
+_RE_CURRENCY = re.compile(r'^([A-Z]{3}|[€$£¥₹₽])')
+_RE_BULK_PRICE = re.compile(r'za szt|per piece|pieces?')
+_RE_TAX = re.compile(r'bez podatku|tax|VAT', re.I)
+_RE_FREE_SHIPPING = re.compile(r'Free shipping|Darmowa dostawa|免费', re.I)
+_RE_DELIVERY_TIMES = [
+    re.compile(r'\b\w{3}\s+\d+\s*-\s*\w{3}\s+\d+\b'),  # Jul 18 - Aug 04
+    re.compile(r'\d+\s*-\s*\d+\s*days?'),  # 7-15 days
+    re.compile(r'\d+\s*dni\b')  # Polish: X dni
+]
+# Lower-case ASCII words every match of the pattern beside them must contain,
+# checked against the lower-cased raw HTML before the text nodes are walked.
+# They hold no whitespace or non-ASCII text, which the page may spell as
+# &nbsp; or a character reference; None means there is no such word
+_KW_BULK_PRICE = ('szt', 'piece')
+_KW_TAX = ('podatku', 'tax', 'vat')
+_KW_DELIVERY_TIMES = [None, ('day',), ('dni',)]
+_RE_SPEC_PAIRS = [
+    re.compile(r'([A-Za-z\s]+):\s*([^\n\r]+)'),
+    re.compile(r'([A-Za-z\s]+)\s*-\s*([^\n\r]+)')
+]
+_RE_GALLERY_SCRIPT = re.compile(r'imagePathList|gallery')
+# Image arrays embedded in scripts -> output key
+_RE_IMAGE_LISTS = {
+    'gallery_images': re.compile(r'"imagePathList":\s*(\[.*?\])'),
+    'thumbnail_images': re.compile(r'"summImagePathList":\s*(\[.*?\])'),
+}
+# window.* data objects, one named group per javascript_data key
+_RE_JS_DATA = re.compile(
+    r'window\.runParams\s*=\s*(?P<runParams>{.*?});'
+    r'|window\._d_c_\.DCData\s*=\s*(?P<DCData>{.*?});'
+    r'|window\.productData\s*=\s*(?P<productData>{.*?});'
+    r'|window\.pageData\s*=\s*(?P<pageData>{.*?});',
+    re.DOTALL
+)
+_JS_DATA_KEYS = ('runParams', 'DCData', 'productData', 'pageData')
+_RE_POLISH = re.compile(r'[ąćęłńóśźż]')
+_RE_FRENCH = re.compile(r'[àáâãäåæçèéêëìíîïñòóôõöøùúûüý]')
+_RE_GERMAN = re.compile(r'[äöüß]')
+
+# Text that is not rendered: script, style and template bodies
+_XP_TEXT = etree.XPath(
+    "descendant-or-self::text()"
+    "[not(ancestor::script or ancestor::style or ancestor::template)]"
+)
+# Every text node and comment in the document, in document order
+_XP_STRINGS = etree.XPath("//text() | //comment()")
+
+
+@functools.lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """
+    Return the ChromeDriver binary path, installing it if needed.
+    
+    A path pinned in the CHROMEDRIVER_PATH environment variable is used as
+    is. Otherwise ChromeDriverManager().install(), which checks the Chrome
+    version and the driver cache on every call, is resolved once per process.
+    """
+    return os.environ.get('CHROMEDRIVER_PATH') or ChromeDriverManager().install()
+
+
+# lxml parsers serialize concurrent use, so each parsing thread gets its own
+_thread_state = threading.local()
+
+
+def _html_parser() -> lxml.html.HTMLParser:
+    """Return this thread's UTF-8 HTML parser, creating it on first use."""
+    parser = getattr(_thread_state, 'parser', None)
+    if parser is None:
+        parser = _thread_state.parser = lxml.html.HTMLParser(encoding='utf-8')
+    return parser
+
+
+def _loads(data: str) -> Any:
+    """Decode JSON with orjson when available, falling back to the json module."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN or oversized integers, which json accepts
+    return json.loads(data)
+
+
+def _dig(data: Any, *keys: str) -> Any:
+    """Follow nested dict keys, returning None as soon as one is missing."""
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _css(selector: str) -> CSSSelector:
+    """Compile a CSS selector with the HTML rules HtmlElement.cssselect() uses."""
+    return CSSSelector(selector, translator='html')
+
+
+def _css_group(selectors: List[CSSSelector]) -> CSSSelector:
+    """Compile a list of fallback selectors into one comma-separated selector."""
+    return _css(', '.join(selector.css for selector in selectors))
+
+
+def _select_one(node, selector: CSSSelector):
+    """Return the first element under node matching a compiled selector, or None."""
+    matches = selector(node)
+    return matches[0] if matches else None
+
+
+def _select_each(node, selectors: List[CSSSelector], group: CSSSelector):
+    """Yield the first match of each fallback selector, in priority order.
+    
+    group is the same list compiled by _css_group. One traversal with it
+    settles the usual cases of no match or a single matching element; the
+    selectors are only run one by one when several elements match, since a
+    selector group returns its matches in document order.
+    """
+    matches = group(node)
+    if len(matches) <= 1:
+        yield from matches
+        return
+    for selector in selectors:
+        elem = _select_one(node, selector)
+        if elem is not None:
+            yield elem
+
+
+def _text(elem, strip: bool = True) -> str:
+    """
+    Return the rendered text of an element (like bs4's get_text()).
+    
+    Args:
+        elem: lxml element
+        strip: Strip every text node and join them without a separator
+        
+    Returns:
+        Text content, skipping script, style and template bodies unless
+        elem is itself a script or style element
+    """
+    if elem.tag in ('script', 'style'):
+        strings = [elem.text or '']
+    else:
+        strings = _XP_TEXT(elem)
+    if strip:
+        return ''.join(text.strip() for text in strings)
+    return ''.join(strings)
+
+
+def _text_prefix(elem, size: int) -> str:
+    """Return the first size characters of _text(elem, strip=False) without joining all of it."""
+    parts = []
+    length = 0
+    for text in _XP_TEXT(elem):
+        parts.append(text)
+        length += len(text)
+        if length >= size:
+            break
+    return ''.join(parts)[:size]
+
+
+def _find_string(tree, pattern, keywords=None, source: Optional[str] = None):
+    """
+    Find the first text node or comment in the document matching a regex.
+    
+    Args:
+        tree: Parsed document
+        pattern: Compiled regex to look for
+        keywords: Lower-case words at least one of which occurs in any
+            match of pattern
+        source: Lower-cased raw HTML the tree was parsed from. If given
+            along with keywords, the text nodes are only walked when one
+            of the keywords occurs in it
+        
+    Returns:
+        Tuple of (matching string, element containing it), or (None, None)
+    """
+    if keywords and source is not None and not any(word in source for word in keywords):
+        return None, None
+    for node in _XP_STRINGS(tree):
+        if isinstance(node, str):
+            if pattern.search(node):
+                parent = node.getparent()
+                if node.is_tail:
+                    parent = parent.getparent()
+                return str(node), parent
+        elif node.text and pattern.search(node.text):
+            return node.text, node.getparent()
+    return None, None
+
+
+def _only_string(elem) -> Optional[str]:
+    """
+    Return the element's sole string, following a chain of only-children
+    (the semantics of bs4's Tag.string), or None if it has mixed content.
+    """
+    while True:
+        if len(elem) == 0:
+            return elem.text
+        if len(elem) > 1 or elem.text or elem[0].tail:
+            return None
+        elem = elem[0]
+
+
 class AliExpressLiveScraper:
     """
     Live AliExpress scraper that fetches pages in real-time and extracts
     comprehensive product information.
     """
     
-    def __init__(self, headless: bool = True, proxy: str = None):
+    __slots__ = ('headless', 'proxy', 'driver', 'product_data', 'session')
+    
+    # Fallback selectors are tried in order; the first one that matches wins
+    _SEL_TITLES = [
+        _css('h1[data-pl="product-title"]'),
+        _css('.title--wrap--UUHae_g h1'),
+        _css('.product-title'),
+        _css('h1')
+    ]
+    _SEL_TITLES_GROUP = _css_group(_SEL_TITLES)
+    _SEL_PRICES = [
+        _css('span.product-price-value'),
+        _css('.price--currentPriceText--V8_y_b5'),
+        _css('.pdp-comp-price-current'),
+        _css('[data-pl="product-price"] .price--current--I3Zeidd span')
+    ]
+    _SEL_PRICES_GROUP = _css_group(_SEL_PRICES)
+    _SEL_ORIGINAL_PRICES = [
+        _css('.price--originalPrice'),
+        _css('.product-price-original'),
+        _css('.price--lineThrough')
+    ]
+    _SEL_ORIGINAL_PRICES_GROUP = _css_group(_SEL_ORIGINAL_PRICES)
+    _SEL_REVIEW_COUNTS = [
+        _css('a[href*="review"]'),
+        _css('.reviewer--reviews--cx7Zs_V'),
+        _css('.review-count')
+    ]
+    _SEL_REVIEW_COUNTS_GROUP = _css_group(_SEL_REVIEW_COUNTS)
+    _SEL_SOLD_COUNTS = [
+        _css('.reviewer--sold--ytPeoEy'),
+        _css('.product-sold-count'),
+        _css('[class*="sold"]')
+    ]
+    _SEL_SOLD_COUNTS_GROUP = _css_group(_SEL_SOLD_COUNTS)
+    _SEL_MAIN_IMAGES = [
+        _css('.magnifier--image--EYYoSlr'),
+        _css('.product-main-image img'),
+        _css('.main-image img')
+    ]
+    _SEL_MAIN_IMAGES_GROUP = _css_group(_SEL_MAIN_IMAGES)
+    _SEL_BRANDS = [
+        _css('.product-brand'),
+        _css('.brand-name'),
+        _css('[data-brand]'),
+        _css('.manufacturer')
+    ]
+    _SEL_BRANDS_GROUP = _css_group(_SEL_BRANDS)
+    
+    _SEL_DISCOUNT = _css('.discount-percent, .sale-percent')
+    _SEL_REVIEW_ITEMS = _css('.list--itemDesc--JcxNPy5, .review-item, .feedback-item')
+    _SEL_SKU_WRAPPER = _css('.sku--wrap--xgoW06M, .product-sku, .sku-wrap')
+    _SEL_SKU_ITEMS = _css('.sku-item--wrap--t9Qszzx, .sku-item')
+    _SEL_CURRENT_SKU = _css('.sku--menuTitle--UIEMJcG, .current-sku')
+    _SEL_QUANTITY = _css('.quantity-selector, input[name*="quantity"]')
+    _SEL_GALLERY_IMAGES = _css('.image-gallery img, .product-images img')
+    _SEL_VIDEO = _css('video source, .product-video')
+    _SEL_DELIVERY_TO = _css('.delivery-v2--to--Mtweg7y, .delivery-location')
+    _SEL_SHIPPING_COST = _css('.shipping-cost, .delivery-cost')
+    _SEL_SHIPPING_METHODS = _css('.shipping-method, .delivery-option')
+    _SEL_SPEC_TABLES = _css('.product-specs table, .specifications table, .product-props table')
+    _SEL_ROWS = _css('tr')
+    _SEL_CELLS = _css('td, th')
+    _SEL_DESCRIPTION = _css('.product-description, .item-description')
+    _SEL_STORE_LINK = _css('a[href*="/store/"], .store-link, .seller-link')
+    _SEL_STORE_NAME = _css('.store-name, .seller-name')
+    _SEL_STORE_RATING = _css('.store-rating, .seller-rating')
+    _SEL_FOLLOWERS = _css('.store-followers, .follower-count')
+    _SEL_YEARS = _css('.store-years, .years-in-business')
+    _SEL_OG_TAGS = _css('meta[property^="og:"]')
+    _SEL_APP_TAGS = _css('meta[property^="al:"]')
+    _SEL_OG_URL = _css('meta[property="og:url"]')
+    _SEL_BREADCRUMBS = _css('.breadcrumb a, .nav-breadcrumb a')
+    _SEL_META_CATEGORY = _css('meta[name="category"]')
+    _SEL_META_LANGUAGE = _css('meta[name="language"]')
+    _SEL_REVIEWER = _css('.reviewer-info, .review-author')
+    _SEL_REVIEW_TEXT = _css('.review-text, .review-content, .list--itemReview--d9Z9Z5Z')
+    _SEL_REVIEW_RATING = _css('.rating, .stars')
+    _SEL_REVIEW_SKU = _css('.sku-info, .variant-info, .list--itemSku--idEQSGC')
+    _SEL_REVIEW_IMAGES = _css('.review-image img')
+    _SEL_VARIATION_TITLE = _css('.sku-item--title--Z0HLO87, .variation-title')
+    _SEL_VARIATION_OPTIONS = _css('[data-sku-col], .variation-option')
+    _SEL_META_NAMES = {
+        name: _css(f'meta[name="{name}"]') for name in ('description', 'keywords', 'author')
+    }
+    
+    def __init__(self, headless: bool = True, proxy: str = None, launch_browser: bool = True):
         """
         Initialize the scraper with browser options.
         
         Args:
             headless: Whether to run browser in headless mode
             proxy: Optional proxy server (format: "host:port")
+            launch_browser: Start Chrome right away; pass False to only use
+                parse_html() on HTML fetched elsewhere
+        
+        Chrome is started here exactly once; scrape_product() and
+        scrape_products() reuse it for every URL until close() is called.
         """
         self.headless = headless
         self.proxy = proxy
         self.driver = None
         self.product_data = {}
-        self.setup_driver()
+        
+        # Pooled keep-alive connections for scrape_product_fast()
+        self.session = requests.Session()
+        self.session.headers.update(HTTP_HEADERS)
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if proxy:
+            self.session.proxies = {'http': f'http://{proxy}', 'https': f'http://{proxy}'}
+        
+        if launch_browser:
+            self.setup_driver()
     
     def setup_driver(self):
         """Setup Chrome driver with options."""
@@ -63,19 +423,36 @@ class AliExpressLiveScraper:
         opts.add_experimental_option("excludeSwitches", ["enable-automation"])
         opts.add_experimental_option('useAutomationExtension', False)
         
+        # Only the HTML and inline JSON are scraped: don't decode images or
+        # wait for subresources once the DOM is ready
+        opts.add_argument("--blink-settings=imagesEnabled=false")
+        opts.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        opts.page_load_strategy = 'eager'
+        
+        # Network events are read back to get the server's HTML (see _document_html)
+        opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        
         # Add user agent to avoid detection
-        opts.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        opts.add_argument(f"--user-agent={USER_AGENT}")
         
         if self.proxy:
             opts.add_argument(f"--proxy-server=http://{self.proxy}")
         
         try:
-            service = Service(ChromeDriverManager().install())
+            service = Service(_chromedriver_path())
             self.driver = webdriver.Chrome(service=service, options=opts)
+            self.driver.set_script_timeout(SETTLE_TIMEOUT)
             
             # Execute script to avoid detection
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
+            # Skip images, media, fonts and trackers
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            
         except Exception as e:
             print(f"Error setting up driver: {e}")
             raise
@@ -100,6 +477,16 @@ class AliExpressLiveScraper:
             # Navigate to the page
             self.driver.get(url)
             
+            # The HTML as sent by the server usually embeds the product JSON;
+            # if it yields the product, skip rendering, scrolling and page_source
+            html_content = self._document_html()
+            if html_content and _RE_RUN_PARAMS.search(html_content):
+                print("Extracting product data from the server HTML...")
+                self.product_data = self.parse_html(html_content, url)
+                if self.product_data['basic_info'].get('title'):
+                    print("Scraping completed successfully!")
+                    return self.product_data
+            
             # Wait for key elements to load
             print("Waiting for page elements to load...")
             WebDriverWait(self.driver, wait_time).until(
@@ -110,22 +497,19 @@ class AliExpressLiveScraper:
                 )
             )
             
-            # Scroll to trigger lazy-loading
+            # Scroll to trigger lazy-loading and wait for the DOM to settle
             print("Scrolling to load additional content...")
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(3)
-            
-            # Scroll back to top
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            try:
+                self.driver.execute_async_script(SCROLL_AND_SETTLE)
+            except TimeoutException:
+                pass  # parse whatever has loaded so far
             
             # Get page source and parse
             html_content = self.driver.page_source
-            soup = BeautifulSoup(html_content, 'html.parser')
             
             # Extract comprehensive data
             print("Extracting product data...")
-            self.product_data = self._extract_all_data(soup, url)
+            self.product_data = self.parse_html(html_content, url)
             
             print("Scraping completed successfully!")
             return self.product_data
@@ -134,53 +518,219 @@ class AliExpressLiveScraper:
             print(f"Error during scraping: {e}")
             return {}
     
-    def _extract_all_data(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def _document_html(self) -> Optional[str]:
+        """
+        Return the current page's HTML exactly as Chrome received it.
+        
+        The main frame's document request is found in the performance log
+        and its body fetched with Network.getResponseBody, which avoids
+        serialising the live DOM.
+        
+        Returns:
+            The response body, or None if it is not available
+        """
+        try:
+            frame_id = self.driver.execute_cdp_cmd("Page.getFrameTree", {})['frameTree']['frame']['id']
+            request_id = None
+            for entry in self.driver.get_log('performance'):
+                if '"Network.responseReceived"' not in entry['message']:
+                    continue
+                params = _loads(entry['message'])['message']['params']
+                if params.get('type') == 'Document' and params.get('frameId') == frame_id:
+                    request_id = params['requestId']
+            
+            if request_id is None:
+                return None
+            
+            body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            if body.get('base64Encoded'):
+                return base64.b64decode(body['body']).decode('utf-8', errors='replace')
+            return body['body']
+            
+        except Exception as e:
+            print(f"Could not read the document response: {e}")
+            return None
+    
+    def scrape_product_fast(self, url: str, wait_time: int = 30) -> Dict[str, Any]:
+        """
+        Scrape a product page over plain HTTP, using the browser only if needed.
+        
+        Product pages normally embed their data as window.runParams in the
+        server HTML, which a single GET returns far faster than a full
+        Chrome render. Pages without it are scraped with scrape_product(),
+        starting the browser on first use.
+        
+        Args:
+            url: AliExpress product URL
+            wait_time: Maximum time to wait for page elements if the browser is used
+            
+        Returns:
+            Dictionary containing all scraped product data
+        """
+        html_content = None
+        try:
+            response = self.session.get(url, timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+            if 'charset' not in response.headers.get('Content-Type', ''):
+                response.encoding = 'utf-8'
+            html_content = response.text
+        except requests.RequestException as e:
+            print(f"HTTP fetch failed, using browser: {e}")
+        
+        # Client-side-rendered pages ship an empty `window.runParams = {};`,
+        # so only keep the static parse if it actually found the product
+        if html_content and _RE_RUN_PARAMS.search(html_content):
+            print(f"Parsing static HTML from: {url}")
+            self.product_data = self.parse_html(html_content, url)
+            if self.product_data['basic_info'].get('title'):
+                return self.product_data
+        
+        if not self.driver:
+            self.setup_driver()
+        return self.scrape_product(url, wait_time)
+    
+    def scrape_products(self, urls: List[str], wait_time: int = 30) -> List[Dict[str, Any]]:
+        """
+        Scrape several product pages on this scraper's browser.
+        
+        Cookies, cache and site storage are cleared between pages with
+        reset() rather than restarting Chrome.
+        
+        Args:
+            urls: AliExpress product URLs
+            wait_time: Maximum time to wait for page elements on each page
+            
+        Returns:
+            Scraped product data for each URL, in order ({} for failures)
+        """
+        results = []
+        for n, url in enumerate(urls):
+            if n:
+                self.reset()
+            results.append(self.scrape_product(url, wait_time))
+        return results
+    
+    @classmethod
+    def scrape_many(cls, urls: List[str], workers: int = 4, headless: bool = True,
+                    proxy: str = None, wait_time: int = 30) -> List[Dict[str, Any]]:
+        """
+        Scrape product pages concurrently, one Chrome per worker thread.
+        
+        Each worker starts a scraper on its first URL and reuses it, with
+        reset() between pages, for every later URL it picks up. All browsers
+        are closed before returning.
+        
+        Args:
+            urls: AliExpress product URLs
+            workers: Number of concurrent browsers
+            headless: Whether to run browsers in headless mode
+            proxy: Optional proxy server (format: "host:port")
+            wait_time: Maximum time to wait for page elements on each page
+            
+        Returns:
+            Scraped product data for each URL, in order ({} for failures)
+        """
+        local = threading.local()
+        scrapers = []
+        
+        def scrape(url: str) -> Dict[str, Any]:
+            scraper = getattr(local, 'scraper', None)
+            if scraper is None:
+                scraper = local.scraper = cls(headless=headless, proxy=proxy)
+                scrapers.append(scraper)
+            else:
+                scraper.reset()
+            return scraper.scrape_product(url, wait_time)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(scrape, urls))
+        finally:
+            for scraper in scrapers:
+                scraper.close()
+    
+    def parse_html(self, html_content: str, url: str) -> Dict[str, Any]:
+        """
+        Extract product data from already-fetched page HTML.
+        
+        Safe to call from several threads on the same instance; the result
+        is not stored in product_data.
+        
+        Args:
+            html_content: Raw HTML of an AliExpress product page
+            url: URL the HTML was fetched from
+            
+        Returns:
+            Dictionary containing all extracted product data
+        """
+        try:
+            tree = lxml.html.document_fromstring(html_content.encode('utf-8'), parser=_html_parser())
+        except etree.ParserError:  # empty document
+            tree = lxml.html.document_fromstring('<html></html>')
+        # Returned rather than stored: batch_scraper shares one instance
+        # across parse threads, so this must not touch self.product_data
+        return self._extract_all_data(tree, url, html_content)
+    
+    def _extract_all_data(self, tree: lxml.html.HtmlElement, url: str,
+                          html_content: Optional[str] = None) -> Dict[str, Any]:
         """Extract all available product data from parsed HTML."""
+        # Inline script bodies are scanned by several extractors; collect them
+        # once (a script with a src attribute never runs its own text)
+        ctx = {
+            'tree': tree,
+            'html': html_content,
+            'html_lower': html_content.lower() if html_content else None,
+            'script_texts': [script.text for script in tree.iter('script')
+                             if script.text and not script.get('src')],
+        }
+        
+        # Structured product data from window.runParams is read first; each
+        # extractor takes what it can from it and only runs its DOM selectors
+        # for the fields it lacks
+        js_data = self._extract_javascript_data(ctx)
+        ctx['run_params'] = _dig(js_data, 'runParams', 'data') or {}
+        
         return {
             'url': url,
-            'basic_info': self._extract_basic_info(soup),
-            'pricing': self._extract_pricing(soup),
-            'reviews_and_ratings': self._extract_reviews_and_ratings(soup),
-            'product_variations': self._extract_product_variations(soup),
-            'images': self._extract_images(soup),
-            'shipping_info': self._extract_shipping_info(soup),
-            'specifications': self._extract_specifications(soup),
-            'seller_info': self._extract_seller_info(soup),
-            'javascript_data': self._extract_javascript_data(soup),
-            'meta_tags': self._extract_meta_tags(soup),
+            'basic_info': self._extract_basic_info(ctx),
+            'pricing': self._extract_pricing(ctx),
+            'reviews_and_ratings': self._extract_reviews_and_ratings(ctx),
+            'product_variations': self._extract_product_variations(ctx),
+            'images': self._extract_images(ctx),
+            'shipping_info': self._extract_shipping_info(ctx),
+            'specifications': self._extract_specifications(tree),
+            'seller_info': self._extract_seller_info(ctx),
+            'javascript_data': js_data,
+            'meta_tags': self._extract_meta_tags(tree),
             'scraping_timestamp': datetime.now().isoformat(),
-            'page_language': self._detect_page_language(soup)
+            'page_language': self._detect_page_language(tree)
         }
     
-    def _extract_basic_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_basic_info(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """Extract basic product information."""
         basic_info = {}
+        tree = ctx['tree']
+        product_info = ctx['run_params'].get('productInfoComponent') or {}
         
         try:
             # Product title
-            title_selectors = [
-                'h1[data-pl="product-title"]',
-                '.title--wrap--UUHae_g h1',
-                '.product-title',
-                'h1'
-            ]
-            
-            for selector in title_selectors:
-                title_elem = soup.select_one(selector)
-                if title_elem:
-                    basic_info['title'] = title_elem.get_text(strip=True)
+            if product_info.get('subject'):
+                basic_info['title'] = product_info['subject']
+            else:
+                for title_elem in _select_each(tree, self._SEL_TITLES, self._SEL_TITLES_GROUP):
+                    basic_info['title'] = _text(title_elem)
                     break
             
             # Product ID
-            product_id = self._extract_product_id(soup)
+            product_id = self._extract_product_id(ctx)
             if product_id:
                 basic_info['product_id'] = product_id
             
             # Category
-            basic_info['category'] = self._extract_category(soup)
+            basic_info['category'] = self._extract_category(ctx)
             
             # Brand information
-            brand = self._extract_brand(soup)
+            brand = self._extract_brand(ctx)
             if brand:
                 basic_info['brand'] = brand
                 
@@ -189,58 +739,50 @@ class AliExpressLiveScraper:
             
         return basic_info
     
-    def _extract_pricing(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_pricing(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """Extract pricing information."""
         pricing = {}
+        tree = ctx['tree']
+        price_data = ctx['run_params'].get('priceComponent')
         
         try:
-            # Current price selectors
-            price_selectors = [
-                'span.product-price-value',
-                '.price--currentPriceText--V8_y_b5',
-                '.pdp-comp-price-current',
-                '[data-pl="product-price"] .price--current--I3Zeidd span'
-            ]
-            
-            for selector in price_selectors:
-                price_elem = soup.select_one(selector)
-                if price_elem:
-                    pricing['current_price'] = price_elem.get_text(strip=True)
+            # Current price
+            current_price = _dig(price_data, 'discountPrice', 'formatedActivityPrice')
+            if current_price:
+                pricing['current_price'] = current_price
+            else:
+                for price_elem in _select_each(tree, self._SEL_PRICES, self._SEL_PRICES_GROUP):
+                    pricing['current_price'] = _text(price_elem)
                     break
             
             # Original price (if discounted)
-            original_price_selectors = [
-                '.price--originalPrice',
-                '.product-price-original',
-                '.price--lineThrough'
-            ]
-            
-            for selector in original_price_selectors:
-                elem = soup.select_one(selector)
-                if elem:
-                    pricing['original_price'] = elem.get_text(strip=True)
+            original_price = _dig(price_data, 'origPrice', 'minAmount', 'formatedAmount')
+            if original_price:
+                pricing['original_price'] = original_price
+            else:
+                for elem in _select_each(tree, self._SEL_ORIGINAL_PRICES, self._SEL_ORIGINAL_PRICES_GROUP):
+                    pricing['original_price'] = _text(elem)
                     break
             
             # Bulk pricing
-            bulk_price_elem = soup.find(string=re.compile(r'za szt|per piece|pieces?'))
+            bulk_price_elem, parent = _find_string(tree, _RE_BULK_PRICE, _KW_BULK_PRICE, ctx['html_lower'])
             if bulk_price_elem:
-                parent = bulk_price_elem.parent
-                if parent:
-                    pricing['bulk_price'] = parent.get_text(strip=True)
+                if parent is not None:
+                    pricing['bulk_price'] = _text(parent)
             
             # Discount percentage
-            discount_elem = soup.select_one('.discount-percent, .sale-percent')
-            if discount_elem:
-                pricing['discount'] = discount_elem.get_text(strip=True)
+            discount_elem = _select_one(tree, self._SEL_DISCOUNT)
+            if discount_elem is not None:
+                pricing['discount'] = _text(discount_elem)
             
             # Currency
             if pricing.get('current_price'):
-                currency_match = re.search(r'^([A-Z]{3}|[€$£¥₹₽])', pricing['current_price'])
+                currency_match = _RE_CURRENCY.search(pricing['current_price'])
                 if currency_match:
                     pricing['currency'] = currency_match.group(1)
             
             # Tax information
-            tax_elem = soup.find(string=re.compile(r'bez podatku|tax|VAT', re.I))
+            tax_elem, _ = _find_string(tree, _RE_TAX, _KW_TAX, ctx['html_lower'])
             if tax_elem:
                 pricing['tax_info'] = tax_elem.strip()
                 
@@ -249,51 +791,50 @@ class AliExpressLiveScraper:
             
         return pricing
     
-    def _extract_reviews_and_ratings(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_reviews_and_ratings(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """Extract review and rating information."""
         reviews = {}
+        tree = ctx['tree']
+        feedback = ctx['run_params'].get('feedbackComponent') or {}
         
         try:
-            # Rating
-            rating_elem = soup.find('strong', string=re.compile(r'\d+\.\d+'))
-            if rating_elem:
-                rating_text = rating_elem.get_text(strip=True)
-                match = re.search(r'(\d+\.\d+)', rating_text)
-                if match:
-                    reviews['rating'] = float(match.group(1))
+            # Rating ('evarageStar' is AliExpress's spelling)
+            match = _RE_DECIMAL.search(str(feedback.get('evarageStar') or ''))
+            if match:
+                reviews['rating'] = float(match.group(1))
+            else:
+                rating_elem = next((strong for strong in tree.iter('strong')
+                                    if _RE_DECIMAL.search(_only_string(strong) or '')), None)
+                if rating_elem is not None:
+                    rating_text = _text(rating_elem)
+                    match = _RE_DECIMAL.search(rating_text)
+                    if match:
+                        reviews['rating'] = float(match.group(1))
             
             # Review count
-            review_selectors = [
-                'a[href*="review"]',
-                '.reviewer--reviews--cx7Zs_V',
-                '.review-count'
-            ]
-            
-            for selector in review_selectors:
-                elem = soup.select_one(selector)
-                if elem and re.search(r'\d+', elem.get_text()):
-                    match = re.search(r'(\d+)', elem.get_text())
+            if isinstance(feedback.get('totalValidNum'), int):
+                reviews['review_count'] = feedback['totalValidNum']
+            else:
+                for elem in _select_each(tree, self._SEL_REVIEW_COUNTS, self._SEL_REVIEW_COUNTS_GROUP):
+                    match = _RE_DIGITS.search(_text(elem, strip=False))
                     if match:
                         reviews['review_count'] = int(match.group(1))
                         break
             
             # Sales count
-            sold_selectors = [
-                '.reviewer--sold--ytPeoEy',
-                '.product-sold-count',
-                '[class*="sold"]'
-            ]
-            
-            for selector in sold_selectors:
-                elem = soup.select_one(selector)
-                if elem and 'sold' in elem.get_text().lower():
-                    match = re.search(r'(\d+)', elem.get_text())
-                    if match:
-                        reviews['sold_count'] = int(match.group(1))
-                        break
+            match = _RE_DIGITS.search(str(_dig(ctx['run_params'], 'tradeComponent', 'formatTradeCount') or ''))
+            if match:
+                reviews['sold_count'] = int(match.group(1))
+            else:
+                for elem in _select_each(tree, self._SEL_SOLD_COUNTS, self._SEL_SOLD_COUNTS_GROUP):
+                    if 'sold' in _text(elem, strip=False).lower():
+                        match = _RE_DIGITS.search(_text(elem, strip=False))
+                        if match:
+                            reviews['sold_count'] = int(match.group(1))
+                            break
             
             # Individual reviews
-            review_items = soup.select('.list--itemDesc--JcxNPy5, .review-item, .feedback-item')
+            review_items = self._SEL_REVIEW_ITEMS(tree)
             individual_reviews = []
             
             for review in review_items[:10]:  # Limit to 10 reviews
@@ -309,15 +850,32 @@ class AliExpressLiveScraper:
             
         return reviews
     
-    def _extract_product_variations(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_product_variations(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """Extract product variations and SKU information."""
         variations = {}
+        tree = ctx['tree']
         
         try:
+            # SKU properties from runParams
+            sku_properties = _dig(ctx['run_params'], 'skuComponent', 'productSKUPropertyList') or []
+            for sku_property in sku_properties:
+                options = []
+                for value in sku_property.get('skuPropertyValues') or []:
+                    option_data = {}
+                    if value.get('skuPropertyImagePath'):
+                        option_data['image'] = value['skuPropertyImagePath']
+                    option_text = value.get('propertyValueDisplayName') or value.get('propertyValueName')
+                    if option_text:
+                        option_data['text'] = option_text
+                    if option_data:
+                        options.append(option_data)
+                if options:
+                    variations[sku_property.get('skuPropertyName', '')] = options
+            
             # SKU wrapper
-            sku_wrapper = soup.select_one('.sku--wrap--xgoW06M, .product-sku, .sku-wrap')
-            if sku_wrapper:
-                sku_items = sku_wrapper.select('.sku-item--wrap--t9Qszzx, .sku-item')
+            sku_wrapper = None if variations else _select_one(tree, self._SEL_SKU_WRAPPER)
+            if sku_wrapper is not None:
+                sku_items = self._SEL_SKU_ITEMS(sku_wrapper)
                 
                 for sku_item in sku_items:
                     variation_data = self._parse_variation_item(sku_item)
@@ -325,14 +883,14 @@ class AliExpressLiveScraper:
                         variations.update(variation_data)
             
             # Current selection
-            current_selection = soup.select_one('.sku--menuTitle--UIEMJcG, .current-sku')
-            if current_selection:
-                variations['current_selection'] = current_selection.get_text(strip=True)
+            current_selection = _select_one(tree, self._SEL_CURRENT_SKU)
+            if current_selection is not None:
+                variations['current_selection'] = _text(current_selection)
             
             # Available quantities
-            quantity_elem = soup.select_one('.quantity-selector, input[name*="quantity"]')
-            if quantity_elem:
-                if quantity_elem.name == 'input':
+            quantity_elem = _select_one(tree, self._SEL_QUANTITY)
+            if quantity_elem is not None:
+                if quantity_elem.tag == 'input':
                     max_qty = quantity_elem.get('max')
                     if max_qty:
                         variations['max_quantity'] = int(max_qty)
@@ -342,63 +900,60 @@ class AliExpressLiveScraper:
             
         return variations
     
-    def _extract_images(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_images(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """Extract product images."""
         images = {}
+        tree = ctx['tree']
+        
+        image_data = ctx['run_params'].get('imageComponent') or {}
         
         try:
-            # Main image
-            main_img_selectors = [
-                '.magnifier--image--EYYoSlr',
-                '.product-main-image img',
-                '.main-image img'
-            ]
-            
-            for selector in main_img_selectors:
-                img = soup.select_one(selector)
-                if img and img.get('src'):
-                    images['main_image'] = img.get('src')
-                    break
+            # Main image: the first gallery image when runParams lists them
+            if image_data.get('imagePathList'):
+                images['main_image'] = image_data['imagePathList'][0]
+            else:
+                for img in _select_each(tree, self._SEL_MAIN_IMAGES, self._SEL_MAIN_IMAGES_GROUP):
+                    if img.get('src'):
+                        images['main_image'] = img.get('src')
+                        break
+            
+            # Gallery images from runParams, else from any script
+            if image_data.get('imagePathList'):
+                images['gallery_images'] = image_data['imagePathList']
+                if image_data.get('summImagePathList'):
+                    images['thumbnail_images'] = image_data['summImagePathList']
             
-            # Gallery images from JavaScript
-            scripts = soup.find_all('script', string=re.compile(r'imagePathList|gallery'))
-            for script in scripts:
-                content = script.get_text()
+            script_texts = () if image_data.get('imagePathList') else ctx['script_texts']
+            for content in script_texts:
+                if not _RE_GALLERY_SCRIPT.search(content):
+                    continue
                 
                 # Extract image arrays
-                image_patterns = [
-                    r'"imagePathList":\s*(\[.*?\])',
-                    r'"summImagePathList":\s*(\[.*?\])',
-                    r'"images?":\s*(\[.*?\])'
-                ]
-                
-                for pattern in image_patterns:
-                    match = re.search(pattern, content)
+                for key, pattern in _RE_IMAGE_LISTS.items():
+                    match = pattern.search(content)
                     if match:
                         try:
-                            image_list = json.loads(match.group(1))
-                            if 'imagePathList' in pattern:
-                                images['gallery_images'] = image_list
-                            elif 'summImagePathList' in pattern:
-                                images['thumbnail_images'] = image_list
+                            images[key] = _loads(match.group(1))
                         except:
                             continue
             
             # Fallback: extract images from img tags
             if not images.get('gallery_images'):
-                img_tags = soup.select('.image-gallery img, .product-images img')
+                img_tags = self._SEL_GALLERY_IMAGES(tree)
                 gallery_imgs = []
+                seen = set()
                 for img in img_tags:
                     src = img.get('src') or img.get('data-src')
-                    if src and src not in gallery_imgs:
+                    if src and src not in seen:
+                        seen.add(src)
                         gallery_imgs.append(src)
                 
                 if gallery_imgs:
                     images['gallery_images'] = gallery_imgs
             
             # Extract video if present
-            video_elem = soup.select_one('video source, .product-video')
-            if video_elem:
+            video_elem = _select_one(tree, self._SEL_VIDEO)
+            if video_elem is not None:
                 video_src = video_elem.get('src') or video_elem.get('data-src')
                 if video_src:
                     images['product_video'] = video_src
@@ -408,47 +963,41 @@ class AliExpressLiveScraper:
             
         return images
     
-    def _extract_shipping_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_shipping_info(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """Extract shipping and delivery information."""
         shipping = {}
+        tree = ctx['tree']
         
         try:
             # Free shipping threshold
-            free_shipping = soup.find(string=re.compile(r'Free shipping|Darmowa dostawa|免费', re.I))
+            free_shipping, parent = _find_string(tree, _RE_FREE_SHIPPING)
             if free_shipping:
-                parent = free_shipping.parent
-                if parent:
-                    shipping['free_shipping_info'] = parent.get_text(strip=True)
+                if parent is not None:
+                    shipping['free_shipping_info'] = _text(parent)
             
             # Delivery time
-            delivery_patterns = [
-                r'\b\w{3}\s+\d+\s*-\s*\w{3}\s+\d+\b',  # Jul 18 - Aug 04
-                r'\d+\s*-\s*\d+\s*days?',  # 7-15 days
-                r'\d+\s*dni\b'  # Polish: X dni
-            ]
-            
-            for pattern in delivery_patterns:
-                delivery_elem = soup.find(string=re.compile(pattern))
+            for pattern, keywords in zip(_RE_DELIVERY_TIMES, _KW_DELIVERY_TIMES):
+                delivery_elem, _ = _find_string(tree, pattern, keywords, ctx['html_lower'])
                 if delivery_elem:
                     shipping['delivery_time'] = delivery_elem.strip()
                     break
             
             # Delivery location
-            delivery_to = soup.select_one('.delivery-v2--to--Mtweg7y, .delivery-location')
-            if delivery_to:
-                shipping['delivery_to'] = delivery_to.get_text(strip=True)
+            delivery_to = _select_one(tree, self._SEL_DELIVERY_TO)
+            if delivery_to is not None:
+                shipping['delivery_to'] = _text(delivery_to)
             
             # Shipping cost
-            shipping_cost = soup.select_one('.shipping-cost, .delivery-cost')
-            if shipping_cost:
-                shipping['shipping_cost'] = shipping_cost.get_text(strip=True)
+            shipping_cost = _select_one(tree, self._SEL_SHIPPING_COST)
+            if shipping_cost is not None:
+                shipping['shipping_cost'] = _text(shipping_cost)
             
             # Shipping methods
-            shipping_methods = soup.select('.shipping-method, .delivery-option')
+            shipping_methods = self._SEL_SHIPPING_METHODS(tree)
             if shipping_methods:
                 methods = []
                 for method in shipping_methods:
-                    method_text = method.get_text(strip=True)
+                    method_text = _text(method)
                     if method_text:
                         methods.append(method_text)
                 shipping['shipping_methods'] = methods
@@ -458,38 +1007,33 @@ class AliExpressLiveScraper:
             
         return shipping
     
-    def _extract_specifications(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_specifications(self, tree: lxml.html.HtmlElement) -> Dict[str, Any]:
         """Extract product specifications."""
         specs = {}
         
         try:
             # Look for specification tables
-            spec_tables = soup.select('.product-specs table, .specifications table, .product-props table')
+            spec_tables = self._SEL_SPEC_TABLES(tree)
             
             for table in spec_tables:
-                rows = table.select('tr')
+                rows = self._SEL_ROWS(table)
                 for row in rows:
-                    cells = row.select('td, th')
+                    cells = self._SEL_CELLS(row)
                     if len(cells) >= 2:
-                        key = cells[0].get_text(strip=True)
-                        value = cells[1].get_text(strip=True)
+                        key = _text(cells[0])
+                        value = _text(cells[1])
                         if key and value:
                             specs[key] = value
             
             # Look for key-value pairs in description
-            desc_section = soup.select_one('.product-description, .item-description')
-            if desc_section:
+            desc_section = _select_one(tree, self._SEL_DESCRIPTION)
+            if desc_section is not None:
                 # Extract specification-like patterns
-                text = desc_section.get_text()
-                spec_patterns = [
-                    r'([A-Za-z\s]+):\s*([^\n\r]+)',
-                    r'([A-Za-z\s]+)\s*-\s*([^\n\r]+)'
-                ]
-                
-                for pattern in spec_patterns:
-                    matches = re.findall(pattern, text)
-                    for match in matches[:10]:  # Limit to avoid noise
-                        key, value = match
+                text = _text(desc_section, strip=False)
+                for pattern in _RE_SPEC_PAIRS:
+                    # Limit to avoid noise; stop scanning once 10 are found
+                    for match in itertools.islice(pattern.finditer(text), 10):
+                        key, value = match.groups()
                         key = key.strip()
                         value = value.strip()
                         if len(key) < 50 and len(value) < 200:  # Reasonable limits
@@ -500,40 +1044,47 @@ class AliExpressLiveScraper:
             
         return specs
     
-    def _extract_seller_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_seller_info(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """Extract seller/store information."""
         seller = {}
+        tree = ctx['tree']
+        seller_data = ctx['run_params'].get('sellerComponent') or {}
         
         try:
             # Store name and link
-            store_link = soup.select_one('a[href*="/store/"], .store-link, .seller-link')
-            if store_link:
+            if seller_data.get('storeName'):
+                seller['store_url'] = seller_data.get('storeURL', '')
+                seller['store_name'] = seller_data['storeName']
+                store_link = None
+            else:
+                store_link = _select_one(tree, self._SEL_STORE_LINK)
+            if store_link is not None:
                 seller['store_url'] = store_link.get('href', '')
                 
-                store_name = store_link.select_one('.store-name, .seller-name')
-                if store_name:
-                    seller['store_name'] = store_name.get_text(strip=True)
-                elif store_link.get_text():
-                    seller['store_name'] = store_link.get_text(strip=True)
+                store_name = _select_one(store_link, self._SEL_STORE_NAME)
+                if store_name is not None:
+                    seller['store_name'] = _text(store_name)
+                elif _text(store_link, strip=False):
+                    seller['store_name'] = _text(store_link)
             
             # Store rating
-            store_rating = soup.select_one('.store-rating, .seller-rating')
-            if store_rating:
-                rating_match = re.search(r'(\d+(?:\.\d+)?)', store_rating.get_text())
+            store_rating = _select_one(tree, self._SEL_STORE_RATING)
+            if store_rating is not None:
+                rating_match = _RE_NUMBER.search(_text(store_rating, strip=False))
                 if rating_match:
                     seller['store_rating'] = float(rating_match.group(1))
             
             # Store followers
-            followers = soup.select_one('.store-followers, .follower-count')
-            if followers:
-                follower_match = re.search(r'(\d+)', followers.get_text())
+            followers = _select_one(tree, self._SEL_FOLLOWERS)
+            if followers is not None:
+                follower_match = _RE_DIGITS.search(_text(followers, strip=False))
                 if follower_match:
                     seller['followers'] = int(follower_match.group(1))
             
             # Years in business
-            years = soup.select_one('.store-years, .years-in-business')
-            if years:
-                year_match = re.search(r'(\d+)', years.get_text())
+            years = _select_one(tree, self._SEL_YEARS)
+            if years is not None:
+                year_match = _RE_DIGITS.search(_text(years, strip=False))
                 if year_match:
                     seller['years_in_business'] = int(year_match.group(1))
                     
@@ -542,45 +1093,37 @@ class AliExpressLiveScraper:
             
         return seller
     
-    def _extract_javascript_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_javascript_data(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """Extract data from JavaScript variables."""
         js_data = {}
         
         try:
-            scripts = soup.find_all('script')
-            
-            for script in scripts:
-                content = script.get_text()
+            for content in ctx['script_texts']:
+                # One pass finds every JS data object; keep the first of each
+                found = {}
+                for match in _RE_JS_DATA.finditer(content):
+                    found.setdefault(match.lastgroup, match.group(match.lastgroup))
                 
-                # Extract various JS data objects
-                js_patterns = {
-                    'runParams': r'window\.runParams\s*=\s*({.*?});',
-                    'DCData': r'window\._d_c_\.DCData\s*=\s*({.*?});',
-                    'productData': r'window\.productData\s*=\s*({.*?});',
-                    'pageData': r'window\.pageData\s*=\s*({.*?});'
-                }
-                
-                for key, pattern in js_patterns.items():
-                    match = re.search(pattern, content, re.DOTALL)
-                    if match:
+                for key in _JS_DATA_KEYS:
+                    if key in found:
                         try:
-                            js_data[key] = json.loads(match.group(1))
+                            js_data[key] = _loads(found[key])
                         except:
                             # If JSON parsing fails, store as string
-                            js_data[key] = match.group(1)
+                            js_data[key] = found[key]
                             
         except Exception as e:
             print(f"Error extracting JavaScript data: {e}")
             
         return js_data
     
-    def _extract_meta_tags(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_meta_tags(self, tree: lxml.html.HtmlElement) -> Dict[str, Any]:
         """Extract meta tag information."""
         meta_data = {}
         
         try:
             # OpenGraph tags
-            og_tags = soup.select('meta[property^="og:"]')
+            og_tags = self._SEL_OG_TAGS(tree)
             for tag in og_tags:
                 prop = tag.get('property', '').replace('og:', '')
                 content = tag.get('content', '')
@@ -588,7 +1131,7 @@ class AliExpressLiveScraper:
                     meta_data[f'og_{prop}'] = content
             
             # App links
-            app_tags = soup.select('meta[property^="al:"]')
+            app_tags = self._SEL_APP_TAGS(tree)
             app_links = {}
             for tag in app_tags:
                 prop = tag.get('property', '')
@@ -600,10 +1143,9 @@ class AliExpressLiveScraper:
                 meta_data['app_links'] = app_links
             
             # Other important meta tags
-            important_meta = ['description', 'keywords', 'author']
-            for meta_name in important_meta:
-                meta_tag = soup.select_one(f'meta[name="{meta_name}"]')
-                if meta_tag:
+            for meta_name, selector in self._SEL_META_NAMES.items():
+                meta_tag = _select_one(tree, selector)
+                if meta_tag is not None:
                     meta_data[meta_name] = meta_tag.get('content', '')
                     
         except Exception as e:
@@ -611,29 +1153,33 @@ class AliExpressLiveScraper:
             
         return meta_data
     
-    def _extract_product_id(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_product_id(self, ctx: Dict[str, Any]) -> Optional[str]:
         """Extract product ID from various sources."""
+        tree = ctx['tree']
         try:
+            # From runParams
+            product_id = _dig(ctx['run_params'], 'productInfoComponent', 'id')
+            if product_id:
+                return str(product_id)
+            
             # From URL in meta tags
-            og_url = soup.select_one('meta[property="og:url"]')
-            if og_url:
+            og_url = _select_one(tree, self._SEL_OG_URL)
+            if og_url is not None:
                 url = og_url.get('content', '')
-                match = re.search(r'/item/(\d+)\.html', url)
+                match = _RE_ITEM_ID.search(url)
                 if match:
                     return match.group(1)
             
             # From current URL (if available)
             if self.driver:
                 current_url = self.driver.current_url
-                match = re.search(r'/item/(\d+)\.html', current_url)
+                match = _RE_ITEM_ID.search(current_url)
                 if match:
                     return match.group(1)
             
             # From JavaScript data
-            scripts = soup.find_all('script')
-            for script in scripts:
-                content = script.get_text()
-                match = re.search(r'productId["\']?\s*:\s*["\']?(\d+)', content)
+            for content in ctx['script_texts']:
+                match = _RE_PRODUCT_ID.search(content)
                 if match:
                     return match.group(1)
                     
@@ -642,21 +1188,29 @@ class AliExpressLiveScraper:
             
         return None
     
-    def _extract_category(self, soup: BeautifulSoup) -> str:
+    def _extract_category(self, ctx: Dict[str, Any]) -> str:
         """Extract product category."""
+        tree = ctx['tree']
         try:
+            # From the runParams breadcrumb path, skipping the DOM walk
+            crumbs = _dig(ctx['run_params'], 'crumbsComponent', 'pathList') or []
+            for crumb in reversed(crumbs):
+                text = (crumb.get('name') or '').strip() if isinstance(crumb, dict) else ''
+                if text and text.lower() not in ['home', 'accueil', 'startseite']:
+                    return text
+            
             # From breadcrumbs
-            breadcrumbs = soup.select('.breadcrumb a, .nav-breadcrumb a')
+            breadcrumbs = self._SEL_BREADCRUMBS(tree)
             if breadcrumbs and len(breadcrumbs) > 1:
                 # Return the last meaningful breadcrumb (excluding Home)
                 for crumb in reversed(breadcrumbs):
-                    text = crumb.get_text(strip=True)
+                    text = _text(crumb)
                     if text.lower() not in ['home', 'accueil', 'startseite']:
                         return text
             
             # From meta category
-            meta_category = soup.select_one('meta[name="category"]')
-            if meta_category:
+            meta_category = _select_one(tree, self._SEL_META_CATEGORY)
+            if meta_category is not None:
                 return meta_category.get('content', '')
             
             return "Unknown"
@@ -664,49 +1218,46 @@ class AliExpressLiveScraper:
         except:
             return "Unknown"
     
-    def _extract_brand(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_brand(self, ctx: Dict[str, Any]) -> Optional[str]:
         """Extract brand information."""
+        tree = ctx['tree']
         try:
+            # From the runParams product properties
+            props = _dig(ctx['run_params'], 'productPropComponent', 'props') or []
+            for prop in props:
+                if isinstance(prop, dict) and prop.get('attrName') == 'Brand Name' and prop.get('attrValue'):
+                    return prop['attrValue']
+            
             # Look for brand in various places
-            brand_selectors = [
-                '.product-brand',
-                '.brand-name',
-                '[data-brand]',
-                '.manufacturer'
-            ]
-            
-            for selector in brand_selectors:
-                elem = soup.select_one(selector)
-                if elem:
-                    brand = elem.get_text(strip=True) or elem.get('data-brand', '')
-                    if brand:
-                        return brand
+            for elem in _select_each(tree, self._SEL_BRANDS, self._SEL_BRANDS_GROUP):
+                brand = _text(elem) or elem.get('data-brand', '')
+                if brand:
+                    return brand
                         
         except:
             pass
             
         return None
     
-    def _detect_page_language(self, soup: BeautifulSoup) -> str:
+    def _detect_page_language(self, tree: lxml.html.HtmlElement) -> str:
         """Detect the language of the page."""
         try:
             # From html lang attribute
-            html_tag = soup.find('html')
-            if html_tag and html_tag.get('lang'):
-                return html_tag.get('lang')
+            if tree.get('lang'):
+                return tree.get('lang')
             
             # From meta tag
-            lang_meta = soup.select_one('meta[name="language"]')
-            if lang_meta:
+            lang_meta = _select_one(tree, self._SEL_META_LANGUAGE)
+            if lang_meta is not None:
                 return lang_meta.get('content', '')
             
             # Detect from content
-            text_sample = soup.get_text()[:1000]
-            if re.search(r'[ąćęłńóśźż]', text_sample):
+            text_sample = _text_prefix(tree, 1000)
+            if _RE_POLISH.search(text_sample):
                 return 'pl'
-            elif re.search(r'[àáâãäåæçèéêëìíîïñòóôõöøùúûüý]', text_sample):
+            elif _RE_FRENCH.search(text_sample):
                 return 'fr'
-            elif re.search(r'[äöüß]', text_sample):
+            elif _RE_GERMAN.search(text_sample):
                 return 'de'
                 
         except:
@@ -720,29 +1271,30 @@ class AliExpressLiveScraper:
         
         try:
             # Reviewer info
-            reviewer_info = review_elem.select_one('.reviewer-info, .review-author')
-            if reviewer_info:
-                review_data['reviewer_info'] = reviewer_info.get_text(strip=True)
+            reviewer_info = _select_one(review_elem, self._SEL_REVIEWER)
+            if reviewer_info is not None:
+                review_data['reviewer_info'] = _text(reviewer_info)
             
             # Review text
-            review_text = review_elem.select_one('.review-text, .review-content, .list--itemReview--d9Z9Z5Z')
-            if review_text:
-                review_data['review_text'] = review_text.get_text(strip=True)
+            review_text = _select_one(review_elem, self._SEL_REVIEW_TEXT)
+            if review_text is not None:
+                review_data['review_text'] = _text(review_text)
             
             # Rating (if present)
-            rating_elem = review_elem.select_one('.rating, .stars')
-            if rating_elem:
-                rating_match = re.search(r'(\d+(?:\.\d+)?)', rating_elem.get('class', '')[0] if rating_elem.get('class') else '')
+            rating_elem = _select_one(review_elem, self._SEL_REVIEW_RATING)
+            if rating_elem is not None:
+                classes = rating_elem.get('class', '').split()
+                rating_match = _RE_NUMBER.search(classes[0] if classes else '')
                 if rating_match:
                     review_data['rating'] = float(rating_match.group(1))
             
             # SKU/variant info
-            sku_elem = review_elem.select_one('.sku-info, .variant-info, .list--itemSku--idEQSGC')
-            if sku_elem:
-                review_data['sku'] = sku_elem.get_text(strip=True)
+            sku_elem = _select_one(review_elem, self._SEL_REVIEW_SKU)
+            if sku_elem is not None:
+                review_data['sku'] = _text(sku_elem)
             
             # Review images
-            review_images = review_elem.select('.review-image img')
+            review_images = self._SEL_REVIEW_IMAGES(review_elem)
             if review_images:
                 image_urls = []
                 for img in review_images:
@@ -763,33 +1315,33 @@ class AliExpressLiveScraper:
         
         try:
             # Variation name
-            title_elem = sku_item.select_one('.sku-item--title--Z0HLO87, .variation-title')
-            if title_elem:
-                variation_name = title_elem.get_text(strip=True).replace(':', '').strip()
+            title_elem = _select_one(sku_item, self._SEL_VARIATION_TITLE)
+            if title_elem is not None:
+                variation_name = _text(title_elem).replace(':', '').strip()
                 
                 # Options
                 options = []
-                option_elems = sku_item.select('[data-sku-col], .variation-option')
+                option_elems = self._SEL_VARIATION_OPTIONS(sku_item)
                 
                 for option in option_elems:
                     option_data = {}
                     
-                    # Option image
-                    img = option.select_one('img')
-                    if img:
+                    # Option image (a plain tag walk, no selector evaluation per option)
+                    img = next(option.iter('img'), None)
+                    if img is not None:
                         option_data['image'] = img.get('src', '')
                         option_data['alt_text'] = img.get('alt', '')
                     
                     # Option text
-                    option_text = option.get_text(strip=True)
+                    option_text = _text(option)
                     if option_text:
                         option_data['text'] = option_text
                     
-                    # Status
-                    classes = option.get('class', [])
-                    if any('selected' in cls for cls in classes):
+                    # Status (the class attribute is searched as one string)
+                    class_attr = option.get('class', '')
+                    if 'selected' in class_attr:
                         option_data['selected'] = True
-                    if any('soldOut' in cls or 'sold-out' in cls for cls in classes):
+                    if 'soldOut' in class_attr or 'sold-out' in class_attr:
                         option_data['sold_out'] = True
                     
                     if option_data:
@@ -815,8 +1367,23 @@ class AliExpressLiveScraper:
             filename = f"aliexpress_product_{product_id}_{timestamp}.json"
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.product_data, f, indent=2, ensure_ascii=False)
+            # Encoded once, indented; only the rare document whose indentation
+            # pushes it past the limit is re-encoded compact (the indented
+            # buffer is released first, so the two never coexist)
+            if orjson is not None:
+                data = orjson.dumps(self.product_data,
+                                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                if len(data) > PRETTY_JSON_LIMIT:
+                    data = None
+                    data = orjson.dumps(self.product_data, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                data = json.dumps(self.product_data, indent=2, ensure_ascii=False).encode('utf-8')
+                if len(data) > PRETTY_JSON_LIMIT:
+                    data = None
+                    data = json.dumps(self.product_data, ensure_ascii=False,
+                                      separators=(',', ':')).encode('utf-8')
+            with open(filename, 'wb') as f:
+                f.write(data)
             print(f"Data saved to: {filename}")
             return True
         except Exception as e:
@@ -825,60 +1392,88 @@ class AliExpressLiveScraper:
     
     def print_summary(self):
         """Print a summary of scraped data."""
-        if not self.product_data:
+        product = self.product_data
+        if not product:
             print("No data available")
             return
         
-        print("\n" + "="*80)
-        print("ALIEXPRESS LIVE SCRAPING SUMMARY")
-        print("="*80)
-        
-        basic = self.product_data.get('basic_info', {})
-        pricing = self.product_data.get('pricing', {})
-        reviews = self.product_data.get('reviews_and_ratings', {})
-        images = self.product_data.get('images', {})
-        shipping = self.product_data.get('shipping_info', {})
-        
-        print(f"URL: {self.product_data.get('url', 'N/A')}")
-        print(f"Product ID: {basic.get('product_id', 'N/A')}")
-        print(f"Title: {basic.get('title', 'N/A')[:100]}...")
-        print(f"Category: {basic.get('category', 'N/A')}")
-        print(f"Brand: {basic.get('brand', 'N/A')}")
-        
-        print(f"\nPricing:")
-        print(f"  Current Price: {pricing.get('current_price', 'N/A')}")
-        print(f"  Original Price: {pricing.get('original_price', 'N/A')}")
-        print(f"  Currency: {pricing.get('currency', 'N/A')}")
-        
-        print(f"\nReviews & Ratings:")
-        print(f"  Rating: {reviews.get('rating', 'N/A')}")
-        print(f"  Review Count: {reviews.get('review_count', 'N/A')}")
-        print(f"  Items Sold: {reviews.get('sold_count', 'N/A')}")
-        
-        print(f"\nImages:")
-        gallery_count = len(images.get('gallery_images', []))
-        thumb_count = len(images.get('thumbnail_images', []))
-        print(f"  Gallery Images: {gallery_count}")
-        print(f"  Thumbnail Images: {thumb_count}")
-        print(f"  Has Video: {'Yes' if images.get('product_video') else 'No'}")
-        
-        print(f"\nShipping:")
-        print(f"  Delivery Time: {shipping.get('delivery_time', 'N/A')}")
-        print(f"  Delivery To: {shipping.get('delivery_to', 'N/A')}")
-        print(f"  Free Shipping: {shipping.get('free_shipping_info', 'N/A')}")
-        
-        variations = self.product_data.get('product_variations', {})
+        basic = product.get('basic_info') or {}
+        pricing = product.get('pricing') or {}
+        reviews = product.get('reviews_and_ratings') or {}
+        images = product.get('images') or {}
+        shipping = product.get('shipping_info') or {}
+        variations = product.get('product_variations') or {}
+        specs = product.get('specifications') or {}
+        
+        title = basic.get('title', 'N/A')
+        if len(title) > 100:
+            title = title[:100]
+        
+        # Collected and printed in one call rather than one print() per line
+        lines = [
+            "",
+            "="*80,
+            "ALIEXPRESS LIVE SCRAPING SUMMARY",
+            "="*80,
+            f"URL: {product.get('url', 'N/A')}",
+            f"Product ID: {basic.get('product_id', 'N/A')}",
+            f"Title: {title}...",
+            f"Category: {basic.get('category', 'N/A')}",
+            f"Brand: {basic.get('brand', 'N/A')}",
+            "",
+            "Pricing:",
+            f"  Current Price: {pricing.get('current_price', 'N/A')}",
+            f"  Original Price: {pricing.get('original_price', 'N/A')}",
+            f"  Currency: {pricing.get('currency', 'N/A')}",
+            "",
+            "Reviews & Ratings:",
+            f"  Rating: {reviews.get('rating', 'N/A')}",
+            f"  Review Count: {reviews.get('review_count', 'N/A')}",
+            f"  Items Sold: {reviews.get('sold_count', 'N/A')}",
+            "",
+            "Images:",
+            f"  Gallery Images: {len(images.get('gallery_images', []))}",
+            f"  Thumbnail Images: {len(images.get('thumbnail_images', []))}",
+            f"  Has Video: {'Yes' if images.get('product_video') else 'No'}",
+            "",
+            "Shipping:",
+            f"  Delivery Time: {shipping.get('delivery_time', 'N/A')}",
+            f"  Delivery To: {shipping.get('delivery_to', 'N/A')}",
+            f"  Free Shipping: {shipping.get('free_shipping_info', 'N/A')}",
+        ]
+        
         if variations:
-            print(f"\nVariations: {len([k for k in variations.keys() if k != 'current_selection'])} types")
+            lines.append("")
+            lines.append(f"Variations: {len([k for k in variations.keys() if k != 'current_selection'])} types")
         
-        specs = self.product_data.get('specifications', {})
         if specs:
-            print(f"Specifications: {len(specs)} items")
+            lines.append(f"Specifications: {len(specs)} items")
         
-        print("="*80)
+        lines.append("="*80)
+        print("\n".join(lines))
+    
+    def reset(self):
+        """
+        Clear cookies, cache and site storage so the next page starts from a clean session.
+        
+        Much cheaper than quitting and relaunching Chrome between URLs.
+        """
+        if not self.driver:
+            return
+        
+        try:
+            origin = self.driver.execute_script("return window.location.origin")
+            if origin and origin.startswith('http'):
+                self.driver.execute_cdp_cmd("Storage.clearDataForOrigin",
+                                            {"origin": origin, "storageTypes": "all"})
+            self.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            self.driver.delete_all_cookies()
+        except Exception as e:
+            print(f"Error resetting browser session: {e}")
     
     def close(self):
-        """Close the browser driver."""
+        """Close the browser driver and the HTTP session."""
+        self.session.close()
         if self.driver:
             self.driver.quit()
             self.driver = None
@@ -894,6 +1489,7 @@ def main():
         print("  --headless=false    Run browser in visible mode")
         print("  --proxy=host:port   Use proxy server")
         print("  --output=filename   Custom output filename")
+        print("  --fast              Fetch the page over HTTP, using the browser only if needed")
         print("\nExample:")
         print("  python live_aliexpress_scraper.py https://www.aliexpress.com/item/1005006722922099.html")
         return
@@ -902,28 +1498,32 @@ def main():
     headless = True
     proxy = None
     output_file = None
+    fast = False
     
     # Parse options
     for arg in sys.argv[2:]:
-        if arg.startswith('--headless='):
-            headless = arg.split('=')[1].lower() == 'true'
-        elif arg.startswith('--proxy='):
-            proxy = arg.split('=')[1]
-        elif arg.startswith('--output='):
-            output_file = arg.split('=')[1]
+        key, has_value, value = arg.partition('=')
+        if key == '--headless' and has_value:
+            headless = value.lower() == 'true'
+        elif key == '--proxy' and has_value:
+            proxy = value
+        elif key == '--output' and has_value:
+            output_file = value
+        elif arg == '--fast':
+            fast = True
     
     # Validate URL
-    if 'aliexpress.com' not in url and 'aliexpress.' not in url:
+    if 'aliexpress.' not in url:
         print("Error: Please provide a valid AliExpress URL")
         return
     
     scraper = None
     try:
         print(f"Initializing scraper (headless={headless})...")
-        scraper = AliExpressLiveScraper(headless=headless, proxy=proxy)
+        scraper = AliExpressLiveScraper(headless=headless, proxy=proxy, launch_browser=not fast)
         
         print("Starting live scraping...")
-        data = scraper.scrape_product(url)
+        data = scraper.scrape_product_fast(url) if fast else scraper.scrape_product(url)
         
         if data:
             scraper.print_summary()
@@ -10,19 +10,53 @@ execution, and analysis.
 import os
 import sys
 import json
-import subprocess
-import time
-from datetime import datetime
 from typing import Dict, Any, List
 
+try:
+    import orjson
+except ImportError:  # fall back to the standard library json module
+    orjson = None
+
+# batch_scraper.py appends one product per line to this file in its output directory
+PRODUCTS_FILE = "products.jsonl"
+
+
+def _loads(data: bytes) -> Any:
+    """Decode JSON with orjson when available, falling back to the json module."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN or oversized integers, which json accepts
+    return json.loads(data)
+
 
 class ScraperManager:
     """Unified manager for AliExpress scraping operations."""
     
+    __slots__ = ('project_dir', 'config_file', '_config', '_script_paths')
+    
+    # Project scripts whose presence show_status reports
+    SCRIPTS = (
+        ("Live Scraper", "live_aliexpress_scraper.py"),
+        ("Batch Scraper", "batch_scraper.py"),
+        ("Data Analyzer", "data_analyzer.py"),
+        ("Comprehensive Scraper", "comprehensive_scraper.py")
+    )
+    
     def __init__(self):
         self.project_dir = os.path.dirname(os.path.abspath(__file__))
         self.config_file = os.path.join(self.project_dir, "scraper_config.json")
-        self.config = self.load_config()
+        self._config = None
+        self._script_paths = [(name, os.path.join(self.project_dir, filename))
+                              for name, filename in self.SCRIPTS]
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuration, read from disk the first time it is needed."""
+        if self._config is None:
+            self._config = self.load_config()
+        return self._config
     
     def load_config(self) -> Dict[str, Any]:
         """Load or create configuration file."""
@@ -53,8 +87,8 @@ class ScraperManager:
         
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    return _loads(f.read())
             except Exception as e:
                 print(f"Error loading config: {e}")
                 return default_config
@@ -68,8 +102,12 @@ class ScraperManager:
             config = self.config
         
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            if orjson is not None:
+                with open(self.config_file, 'wb') as f:
+                    f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.config_file, 'w', encoding='utf-8') as f:
+                    json.dump(config, f, indent=2)
             print(f"Configuration saved to {self.config_file}")
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -85,16 +123,18 @@ class ScraperManager:
             return False
         
         try:
-            # Install requirements
+            import subprocess
+            
+            # Install requirements (pip's output goes straight to the console)
             print("Installing Python dependencies...")
             result = subprocess.run([
                 sys.executable, "-m", "pip", "install", "-r", req_file
-            ], capture_output=True, text=True)
+            ], text=True)
             
             if result.returncode == 0:
                 print("✓ Dependencies installed successfully")
             else:
-                print(f"✗ Error installing dependencies: {result.stderr}")
+                print(f"✗ Error installing dependencies (pip exited with status {result.returncode})")
                 return False
             
             # Check Chrome/Chromium availability
@@ -120,6 +160,36 @@ class ScraperManager:
             print(f"Error during setup: {e}")
             return False
     
+    def _run_script(self, module_name: str, args: List[str]) -> bool:
+        """
+        Run one of the project scripts' main() in this process.
+        
+        Saves starting a new interpreter (and re-importing selenium, lxml,
+        pandas...) for every run. The script sees args as its command line.
+        
+        Args:
+            module_name: Script module in the project directory, e.g. "batch_scraper"
+            args: Command-line arguments, without the script name
+            
+        Returns:
+            True unless the script exited with a non-zero status
+        """
+        import importlib
+        
+        if self.project_dir not in sys.path:
+            sys.path.insert(0, self.project_dir)
+        module = importlib.import_module(module_name)
+        
+        saved_argv = sys.argv
+        sys.argv = [f"{module_name}.py"] + args
+        try:
+            module.main()
+        except SystemExit as e:
+            return not e.code
+        finally:
+            sys.argv = saved_argv
+        return True
+    
     def run_single_scrape(self, url: str, options: Dict[str, Any] = None):
         """Run single product scraping."""
         print(f"Scraping single product: {url}")
@@ -127,34 +197,27 @@ class ScraperManager:
         if options is None:
             options = {}
         
-        # Build command
-        cmd = [
-            sys.executable, 
-            os.path.join(self.project_dir, "live_aliexpress_scraper.py"),
-            url
-        ]
+        # Build arguments
+        args = [url]
         
         # Add options
         headless = options.get('headless', self.config['scraping']['headless'])
-        cmd.append(f"--headless={str(headless).lower()}")
+        args.append(f"--headless={str(headless).lower()}")
         
         proxy = options.get('proxy', self.config['scraping']['proxy'])
         if proxy:
-            cmd.append(f"--proxy={proxy}")
+            args.append(f"--proxy={proxy}")
         
         output_file = options.get('output_file')
         if output_file:
-            cmd.append(f"--output={output_file}")
+            args.append(f"--output={output_file}")
         
         # Run scraping
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
+            if self._run_script("live_aliexpress_scraper", args):
                 print("✓ Single scraping completed successfully")
-                print(result.stdout)
             else:
                 print("✗ Scraping failed")
-                print(result.stderr)
         except Exception as e:
             print(f"Error running single scrape: {e}")
     
@@ -170,37 +233,34 @@ class ScraperManager:
             print(f"URLs file not found: {urls_file}")
             return
         
-        # Build command
-        cmd = [
-            sys.executable,
-            os.path.join(self.project_dir, "batch_scraper.py"),
-            urls_file
-        ]
+        # Build arguments
+        args = [urls_file]
         
         # Add options
         limit = options.get('limit', self.config['batch']['default_limit'])
         if limit:
-            cmd.append(f"--limit={limit}")
+            args.append(f"--limit={limit}")
         
         headless = options.get('headless', self.config['scraping']['headless'])
-        cmd.append(f"--headless={str(headless).lower()}")
+        args.append(f"--headless={str(headless).lower()}")
         
         proxy = options.get('proxy', self.config['scraping']['proxy'])
         if proxy:
-            cmd.append(f"--proxy={proxy}")
+            args.append(f"--proxy={proxy}")
         
         rate_limit = options.get('rate_limit', self.config['scraping']['rate_limit'])
-        cmd.append(f"--rate-limit={rate_limit}")
+        args.append(f"--rate-limit={rate_limit}")
+        
+        retries = self.config['batch']['max_retries'] if self.config['batch']['retry_failed'] else 0
+        args.append(f"--max-retries={options.get('max_retries', retries)}")
         
         output_dir = options.get('output_dir', self.config['batch']['output_dir'])
-        cmd.append(f"--output={output_dir}")
+        args.append(f"--output={output_dir}")
         
         # Run batch scraping
         try:
-            print(f"Running command: {' '.join(cmd)}")
-            result = subprocess.run(cmd, text=True)
-            
-            if result.returncode == 0:
+            print(f"Running batch_scraper.py {' '.join(args)}")
+            if self._run_script("batch_scraper", args):
                 print("✓ Batch scraping completed")
                 
                 # Auto-analyze if configured
@@ -223,17 +283,9 @@ class ScraperManager:
         
         print(f"Analyzing data from: {data_path}")
         
-        # Build command
-        cmd = [
-            sys.executable,
-            os.path.join(self.project_dir, "data_analyzer.py"),
-            data_path
-        ]
-        
         # Run analysis
         try:
-            result = subprocess.run(cmd, text=True)
-            if result.returncode == 0:
+            if self._run_script("data_analyzer", [data_path]):
                 print("✓ Data analysis completed")
             else:
                 print("✗ Data analysis failed")
@@ -251,10 +303,7 @@ class ScraperManager:
             ("Configuration", self.config_file),
             ("URLs File", os.path.join(self.project_dir, self.config['files']['urls_file'])),
             ("Requirements", os.path.join(self.project_dir, self.config['files']['requirements_file'])),
-            ("Live Scraper", os.path.join(self.project_dir, "live_aliexpress_scraper.py")),
-            ("Batch Scraper", os.path.join(self.project_dir, "batch_scraper.py")),
-            ("Data Analyzer", os.path.join(self.project_dir, "data_analyzer.py")),
-            ("Comprehensive Scraper", os.path.join(self.project_dir, "comprehensive_scraper.py"))
+            *self._script_paths
         ]
         
         print("\nFILES:")
@@ -265,10 +314,21 @@ class ScraperManager:
         # Check data directories
         data_dir = os.path.join(self.project_dir, self.config['batch']['output_dir'])
         if os.path.exists(data_dir):
-            json_files = [f for f in os.listdir(data_dir) if f.endswith('.json')]
+            with os.scandir(data_dir) as entries:
+                json_count = sum(1 for entry in entries
+                                 if entry.name.endswith('.json') and entry.is_file())
+            
+            # Batch runs write products.jsonl; a complete record ends in a newline
+            product_count = 0
+            products_path = os.path.join(data_dir, PRODUCTS_FILE)
+            if os.path.isfile(products_path):
+                with open(products_path, 'rb') as f:
+                    product_count = sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(1 << 20), b""))
+            
             print(f"\nDATA:")
             print(f"  Data Directory: {data_dir}")
-            print(f"  Scraped Files: {len(json_files)} JSON files")
+            print(f"  Scraped Products: {product_count} in {PRODUCTS_FILE}")
+            print(f"  Scraped Files: {json_count} JSON files")
         
         # Show configuration
         print(f"\nCONFIGURATION:")
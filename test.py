@@ -1,4 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+
+# One session for every check, so repeat checks through the same proxy
+# reuse its connection; the pool must hold at least one per worker
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_maxsize=64))
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=64))
 
 def check_proxy(proxy: str, test_url: str = "https://httpbin.org/ip", timeout: int = 10) -> None:
     proxy_dict = {
@@ -7,7 +16,7 @@ def check_proxy(proxy: str, test_url: str = "https://httpbin.org/ip", timeout: i
     }
 
     try:
-        response = requests.get(test_url, proxies=proxy_dict, timeout=timeout)
+        response = _SESSION.get(test_url, proxies=proxy_dict, timeout=timeout)
         response.raise_for_status()
         ip_info = response.json()
         print(f"[✅] Proxy {proxy} is working. IP seen: {ip_info['origin']}")
@@ -20,8 +29,9 @@ def main():
         "5.79.66.2:13151",
     ]
 
-    for proxy in proxies:
-        check_proxy(proxy)
+    # Each check mostly waits on the network, so run them side by side
+    with ThreadPoolExecutor(max_workers=min(32, len(proxies))) as executor:
+        list(executor.map(check_proxy, proxies))
 
 if __name__ == "__main__":
     main()